@@ -18,6 +18,7 @@ from ai_client import AIClient
 from config import Config
 from feedback_manager import FeedbackManager
 from file_processor import FileProcessor
+from json_utils import json_loads
 from models import (
     CandidateFiles,
     DisplayResult,
@@ -34,15 +35,21 @@ from output_generator import OutputGenerator
 class CandidateReviewer:
     """Main application class for candidate review system."""
 
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, ai_client: Optional[AIClient] = None):
         """Initialize candidate reviewer.
 
         Args:
             config: Configuration object
+            ai_client: Ready-made AI client to use instead of connecting with
+                the configured API key; skips the model connection check
         """
         self.config = config
         # Initialize AI connectivity and components
-        if config.openai_api_key:
+        if ai_client is not None:
+            self.connection_tester = None
+            self.ai_client = ai_client
+            self.selected_model = ai_client.model
+        elif config.openai_api_key:
             # Test connection and get best model
             connection_tester = OpenAIConnectionTester(
                 config.openai_api_key, config.preferred_model
@@ -188,124 +195,7 @@ class CandidateReviewer:
         # Save updated meta
         with open(meta_path, "w", encoding="utf-8") as f:
             json.dump(meta, f, indent=2, ensure_ascii=False)
-
-    def _is_candidate_rejected(self, job_name: str, candidate_name: str) -> bool:
-        """Check if a candidate is marked as rejected.
-
-        Args:
-            job_name: Name of the job
-            candidate_name: Name of the candidate
-
-        Returns:
-            True if candidate is rejected, False otherwise
-        """
-        # First check the exact candidate directory
-        candidate_dir = Path(self.config.get_candidate_path(job_name, candidate_name))
-        meta_path = candidate_dir / "candidate_meta.json"
-
-        if meta_path.exists():
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    if meta.get("rejected", False):
-                        return True
-            except (json.JSONDecodeError, KeyError):
-                pass
-
-        # Also check other directories that might be the same candidate
-        # (due to deduplication/name variations)
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return False
-
-        for other_dir in candidates_path.iterdir():
-            if not other_dir.is_dir():
-                continue
-
-            # Skip if it's the same directory we already checked
-            if other_dir == candidate_dir:
-                continue
-
-            # Check if this directory represents the same candidate
-            if self.output_generator._are_same_candidate(
-                candidate_name, other_dir.name
-            ):
-                other_meta_path = other_dir / "candidate_meta.json"
-                if other_meta_path.exists():
-                    try:
-                        with open(other_meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                            if meta.get("rejected", False):
-                                return True
-                    except (json.JSONDecodeError, KeyError):
-                        pass
-
-        return False
-
-    def _get_rejection_info(self, job_name: str, candidate_name: str) -> Optional[dict]:
-        """Get rejection information for a candidate.
-
-        Args:
-            job_name: Name of the job
-            candidate_name: Name of the candidate
-
-        Returns:
-            Dict with rejection info or None if not rejected
-        """
-        # First check the exact candidate directory
-        candidate_dir = Path(self.config.get_candidate_path(job_name, candidate_name))
-        meta_path = candidate_dir / "candidate_meta.json"
-
-        if meta_path.exists():
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    if meta.get("rejected", False):
-                        return {
-                            "reason": meta.get(
-                                "rejection_reason", "No reason provided"
-                            ),
-                            "timestamp": meta.get("rejection_timestamp", "Unknown"),
-                        }
-            except (json.JSONDecodeError, KeyError):
-                pass
-
-        # Also check other directories that might be the same candidate
-        # (due to deduplication/name variations)
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return None
-
-        for other_dir in candidates_path.iterdir():
-            if not other_dir.is_dir():
-                continue
-
-            # Skip if it's the same directory we already checked
-            if other_dir == candidate_dir:
-                continue
-
-            # Check if this directory represents the same candidate
-            if self.output_generator._are_same_candidate(
-                candidate_name, other_dir.name
-            ):
-                other_meta_path = other_dir / "candidate_meta.json"
-                if other_meta_path.exists():
-                    try:
-                        with open(other_meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                            if meta.get("rejected", False):
-                                return {
-                                    "reason": meta.get(
-                                        "rejection_reason", "No reason provided"
-                                    ),
-                                    "timestamp": meta.get(
-                                        "rejection_timestamp", "Unknown"
-                                    ),
-                                }
-                    except (json.JSONDecodeError, KeyError):
-                        pass
-
-        return None
+        self.output_generator.invalidate_job_cache(job_name)
 
     def _list_job_candidates(self, job_name: str) -> list[str]:
         from pathlib import Path
@@ -690,7 +580,7 @@ class CandidateReviewer:
                         f"   Screening filters: ✓ {len(screening_filters['filters'])} filter(s)"
                     )
                     for f in screening_filters["filters"]:
-                        if f.get("enabled", True):
+                        if isinstance(f, dict) and f.get("enabled", True):
                             print(f"     - {f.get('id')}: {f.get('title')}")
                 else:
                     print("   Screening filters: ✗ None")
@@ -834,6 +724,14 @@ class CandidateReviewer:
             # Load screening filters if available
             screening_filters = self._load_screening_filters(job_name)
 
+            from policy.filter_enforcer import (
+                compile_filter_actions,
+                enforce_filters_on_evaluation,
+            )
+
+            # Shared by every candidate in this batch
+            filter_actions = compile_filter_actions(screening_filters)
+
             if verbose:
                 print("\n🔍 VERBOSE MODE: Loaded resources")
                 print(f"   Job insights: {'✓ Loaded' if job_insights else '✗ None'}")
@@ -842,7 +740,7 @@ class CandidateReviewer:
                         f"   Screening filters: ✓ {len(screening_filters['filters'])} filter(s)"
                     )
                     for f in screening_filters["filters"]:
-                        if f.get("enabled", True):
+                        if isinstance(f, dict) and f.get("enabled", True):
                             print(f"     - {f.get('id')}: {f.get('title')}")
                 else:
                     print("   Screening filters: ✗ None")
@@ -940,12 +838,8 @@ class CandidateReviewer:
                     # Enforce screening filters via policy layer
                     if evaluation:
                         try:
-                            from policy.filter_enforcer import (
-                                enforce_filters_on_evaluation,
-                            )
-
                             evaluation = enforce_filters_on_evaluation(
-                                evaluation, screening_filters, verbose
+                                evaluation, screening_filters, verbose, filter_actions
                             )
                         except Exception:
                             pass
@@ -1222,6 +1116,10 @@ class CandidateReviewer:
         Returns:
             True if connection successful, False otherwise
         """
+        if self.ai_client and not self.connection_tester:
+            print("❌ Connection test unavailable for injected client")
+            return False
+
         if not self.ai_client:
             print("❌ OpenAI API key not configured")
             print("Please set OPENAI_API_KEY in your .env file")
@@ -1244,7 +1142,10 @@ class CandidateReviewer:
     def list_available_models(self) -> None:
         """List available OpenAI models."""
         if not self.connection_tester:
-            print("❌ OpenAI API key not configured")
+            if self.ai_client:
+                print("❌ Model listing unavailable for injected client")
+            else:
+                print("❌ OpenAI API key not configured")
             return
 
         print("🔄 Fetching available models...")
@@ -1384,8 +1285,8 @@ class CandidateReviewer:
             print(f"❌ No evaluation found for {candidate_name}")
             return
 
-        with open(eval_path, "r", encoding="utf-8") as f:
-            eval_data = json.load(f)
+        with open(eval_path, "rb") as f:
+            eval_data = json_loads(f.read())
             evaluation = Evaluation.from_dict(eval_data)
 
         # Display current evaluation
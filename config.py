@@ -1,11 +1,28 @@
 """Configuration management for AI Job Candidate Reviewer."""
 
+import hashlib
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+
+@lru_cache(maxsize=32)
+def _parse_env_cached(path: str, digest: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a .env file without interpolation, once per (path, content digest).
+
+    Args:
+        path: Path of the .env file
+        digest: SHA-256 of the file contents, so edits are picked up
+
+    Returns:
+        Tuple of (name, value) pairs; entries without a value are skipped
+    """
+    values = dotenv_values(path, interpolate=False)
+    return tuple((key, value) for key, value in values.items() if value is not None)
 
 
 @dataclass
@@ -33,8 +50,17 @@ class Config:
 
     def load_env(self) -> None:
         """Load environment variables from .env file."""
-        if os.path.exists(self.env_file):
+        if not os.path.exists(self.env_file):
+            return
+        data = Path(self.env_file).read_bytes()
+        if b"${" in data:
+            # ${VAR} expands against the current environment; let dotenv do it
             load_dotenv(self.env_file)
+            return
+        # Without interpolation this matches load_dotenv(): existing variables win
+        digest = hashlib.sha256(data).hexdigest()
+        for key, value in _parse_env_cached(self.env_file, digest):
+            os.environ.setdefault(key, value)
 
     def _setup_paths(self) -> None:
         """Setup and create necessary directory paths."""
@@ -87,6 +113,11 @@ class Config:
         """Get maximum file size limit in bytes."""
         return self.max_file_size_mb * 1024 * 1024
 
+    @property
+    def load_workers(self) -> int:
+        """Get the number of threads used to read candidate files (1 = serial)."""
+        return max(1, int(os.getenv("LOAD_WORKERS", "8")))
+
     @property
     def preferred_model(self) -> Optional[str]:
         """Get preferred OpenAI model."""
@@ -1,12 +1,14 @@
 """Feedback management for AI Job Candidate Reviewer."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from ai_client import AIClient
 from config import Config
+from json_utils import json_dumps, json_dumps_bytes, json_loads
 from models import Evaluation, FeedbackRecord, HumanFeedback, JobInsights
 
 
@@ -45,8 +47,8 @@ class FeedbackManager:
                 f"No evaluation found for {candidate_name} in job {job_name}"
             )
 
-        with open(eval_path, "r", encoding="utf-8") as f:
-            eval_data = json.load(f)
+        with open(eval_path, "rb") as f:
+            eval_data = json_loads(f.read())
             original_evaluation = Evaluation.from_dict(eval_data)
 
         # Create feedback record
@@ -60,7 +62,7 @@ class FeedbackManager:
         # Save feedback to candidate directory
         feedback_path = Path(candidate_dir) / "feedback.json"
         with open(feedback_path, "w", encoding="utf-8") as f:
-            json.dump(feedback_record.to_dict(), f, indent=2, ensure_ascii=False)
+            f.write(json_dumps(feedback_record.to_dict(native_datetimes=True)))
 
         # Update job-level feedback summary
         self._update_job_feedback_summary(job_name, feedback_record)
@@ -144,7 +146,7 @@ class FeedbackManager:
         insights_path = Path(job_dir) / "insights.json"
 
         with open(insights_path, "w", encoding="utf-8") as f:
-            json.dump(job_insights.to_dict(), f, indent=2, ensure_ascii=False)
+            f.write(json_dumps(job_insights.to_dict(native_datetimes=True)))
 
         print(f"✅ Generated new insights for {job_name}")
         print(f"   Based on {len(feedback_records)} feedback records")
@@ -213,8 +215,16 @@ class FeedbackManager:
         # Clean up stale duplicate warnings before re-evaluation
         self._cleanup_stale_duplicate_warnings(job_name)
 
+        # Rejection metadata for the whole job, read once. Re-evaluation only
+        # writes evaluation.json, so rejections cannot change during the loop.
+        from output_generator import OutputGenerator
+
+        output_generator = OutputGenerator(self.config)
+        job_meta = {} if candidate_names else output_generator._load_job_meta(job_name)
+
         # Load existing evaluations and sort by score to process top candidates first
         candidate_scores = []
+        skipped_rejected = []
         for candidate_dir in candidates_path.iterdir():
             if candidate_dir.is_dir():
                 candidate_name = candidate_dir.name
@@ -224,21 +234,20 @@ class FeedbackManager:
                     continue
 
                 # Skip rejected candidates (unless explicitly requested by name)
-                if not candidate_names and self._is_candidate_rejected(
-                    job_name, candidate_name
+                if not candidate_names and output_generator._is_candidate_rejected(
+                    job_name, candidate_name, job_meta
                 ):
+                    skipped_rejected.append(candidate_name)
                     continue
 
                 # Load existing score for sorting (if available)
-                eval_path = candidate_dir / "evaluation.json"
+                eval_path = os.path.join(candidate_dir, "evaluation.json")
                 score = 0  # Default for candidates without evaluation
-                if eval_path.exists():
-                    try:
-                        with open(eval_path, "r", encoding="utf-8") as f:
-                            eval_data = json.load(f)
-                            score = eval_data.get("overall_score", 0)
-                    except Exception:
-                        pass
+                try:
+                    with open(eval_path, "rb") as f:
+                        score = json_loads(f.read()).get("overall_score", 0)
+                except Exception:
+                    pass
 
                 candidate_scores.append((score, candidate_name, candidate_dir))
 
@@ -246,18 +255,10 @@ class FeedbackManager:
         candidate_scores.sort(key=lambda x: x[0], reverse=True)
 
         re_evaluated = []
-        skipped_rejected = []
         total_candidates = len(candidate_scores)
         current_count = 0
 
         for score, candidate_name, candidate_dir in candidate_scores:
-            # Double-check rejection status (in case it changed)
-            if not candidate_names and self._is_candidate_rejected(
-                job_name, candidate_name
-            ):
-                skipped_rejected.append(candidate_name)
-                continue
-
             current_count += 1
 
             # Load candidate data
@@ -277,8 +278,8 @@ class FeedbackManager:
             previous_score = None
             if prev_eval_path.exists():
                 try:
-                    with open(prev_eval_path, "r", encoding="utf-8") as f:
-                        prev_data = json.load(f)
+                    with open(prev_eval_path, "rb") as f:
+                        prev_data = json_loads(f.read())
                         previous_score = prev_data.get("overall_score")
                 except Exception:
                     previous_score = None
@@ -342,8 +343,8 @@ class FeedbackManager:
                     if candidate_dir.is_dir():
                         eval_path = candidate_dir / "evaluation.json"
                         if eval_path.exists():
-                            with open(eval_path, "r", encoding="utf-8") as f:
-                                eval_data = json.load(f)
+                            with open(eval_path, "rb") as f:
+                                eval_data = json_loads(f.read())
                                 evaluation = Evaluation.from_dict(eval_data)
                                 evaluations.append(evaluation)
 
@@ -486,100 +487,47 @@ class FeedbackManager:
         Args:
             job_name: Name of the job
         """
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
+        candidates_path = os.path.join(self.config.candidates_path, job_name)
+        try:
+            candidate_dirs = [
+                entry for entry in os.scandir(candidates_path) if entry.is_dir()
+            ]
+        except (FileNotFoundError, NotADirectoryError):
             return
 
         # Get list of all existing candidate names
-        existing_candidates = {d.name for d in candidates_path.iterdir() if d.is_dir()}
+        existing_candidates = {entry.name for entry in candidate_dirs}
 
         removed_count = 0
-        for candidate_dir in candidates_path.iterdir():
-            if not candidate_dir.is_dir():
+        for entry in candidate_dirs:
+            warning_path = os.path.join(entry.path, "DUPLICATE_WARNING.txt")
+            try:
+                with open(warning_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            except (OSError, ValueError):
+                # No warning, or we can't read it; skip
                 continue
 
-            warning_path = candidate_dir / "DUPLICATE_WARNING.txt"
-            if warning_path.exists():
-                try:
-                    content = warning_path.read_text(encoding="utf-8")
-                    # Parse the referenced candidate name from the warning
-                    # Format: "This profile shares identifiers with: other_name"
-                    for line in content.splitlines():
-                        if "shares identifiers with:" in line:
-                            # Extract the other candidate name
-                            other_name = line.split("shares identifiers with:")[
-                                -1
-                            ].strip()
-
-                            # Check if the other candidate still exists
-                            if other_name not in existing_candidates:
-                                # Remove the stale warning
-                                warning_path.unlink()
-                                removed_count += 1
-                                break
-                except (OSError, Exception):
-                    # If we can't read/parse the file, skip it
-                    pass
+            # Parse the referenced candidate name from the warning
+            # Format: "This profile shares identifiers with: other_name"
+            for line in content.splitlines():
+                if "shares identifiers with:" in line:
+                    # Extract the other candidate name
+                    other_name = line.split("shares identifiers with:")[-1].strip()
+
+                    # Check if the other candidate still exists
+                    if other_name not in existing_candidates:
+                        # Remove the stale warning
+                        try:
+                            os.remove(warning_path)
+                            removed_count += 1
+                        except OSError:
+                            pass
+                        break
 
         if removed_count > 0:
             print(f"   🧹 Cleaned up {removed_count} stale duplicate warning(s)")
 
-    def _is_candidate_rejected(self, job_name: str, candidate_name: str) -> bool:
-        """Check if a candidate is marked as rejected.
-
-        Args:
-            job_name: Name of the job
-            candidate_name: Name of the candidate
-
-        Returns:
-            True if candidate is rejected, False otherwise
-        """
-        # First check the exact candidate directory
-        candidate_dir = Path(self.config.get_candidate_path(job_name, candidate_name))
-        meta_path = candidate_dir / "candidate_meta.json"
-
-        if meta_path.exists():
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    if meta.get("rejected", False):
-                        return True
-            except (json.JSONDecodeError, KeyError):
-                pass
-
-        # Also check other directories that might be the same candidate
-        # (due to deduplication/name variations)
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return False
-
-        # Import needed for name comparison
-        from output_generator import OutputGenerator
-
-        output_gen = OutputGenerator(self.config)
-
-        for other_dir in candidates_path.iterdir():
-            if not other_dir.is_dir():
-                continue
-
-            # Skip if it's the same directory we already checked
-            if other_dir == candidate_dir:
-                continue
-
-            # Check if this directory represents the same candidate
-            if output_gen._are_same_candidate(candidate_name, other_dir.name):
-                other_meta_path = other_dir / "candidate_meta.json"
-                if other_meta_path.exists():
-                    try:
-                        with open(other_meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                            if meta.get("rejected", False):
-                                return True
-                    except (json.JSONDecodeError, KeyError):
-                        pass
-
-        return False
-
     def _load_candidate_data(self, candidate_dir: Path):
         """Load candidate data from directory."""
         # Load candidate files and reconstruct Candidate object
@@ -632,27 +580,27 @@ class FeedbackManager:
         history = []
         if history_path.exists():
             try:
-                with open(history_path, "r", encoding="utf-8") as f:
-                    history = json.load(f)
+                with open(history_path, "rb") as f:
+                    history = json_loads(f.read())
             except json.JSONDecodeError:
                 history = []
 
         # Add current evaluation to history if it exists
         if eval_path.exists():
             try:
-                with open(eval_path, "r", encoding="utf-8") as f:
-                    current_eval = json.load(f)
+                with open(eval_path, "rb") as f:
+                    current_eval = json_loads(f.read())
                     history.append(current_eval)
             except json.JSONDecodeError:
                 pass
 
         # Save new evaluation
-        with open(eval_path, "w", encoding="utf-8") as f:
-            json.dump(evaluation.to_dict(), f, indent=2, ensure_ascii=False)
+        with open(eval_path, "wb") as f:
+            f.write(json_dumps_bytes(evaluation.to_dict(native_datetimes=True)))
 
         # Save history
-        with open(history_path, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        with open(history_path, "wb") as f:
+            f.write(json_dumps_bytes(history))
 
     def _calculate_effectiveness_metrics(
         self,
@@ -106,14 +106,14 @@ class FileProcessor:
             Tuple of (JobFiles object, list of error messages)
         """
         errors = []
-        job_files = JobFiles(job_name=job_name)
+        paths = {}
 
         # Look for job description file (required)
         job_desc_path = self._find_file_in_intake("job_description")
         if job_desc_path:
             size_ok, size_error = self._validate_file_size(job_desc_path)
             if size_ok:
-                job_files.job_description_path = job_desc_path
+                paths["job_description_path"] = job_desc_path
             else:
                 errors.append(f"Job description file: {size_error}")
         else:
@@ -126,7 +126,7 @@ class FileProcessor:
         if ideal_candidate_path:
             size_ok, size_error = self._validate_file_size(ideal_candidate_path)
             if size_ok:
-                job_files.ideal_candidate_path = ideal_candidate_path
+                paths["ideal_candidate_path"] = ideal_candidate_path
             else:
                 errors.append(f"Ideal candidate file: {size_error}")
 
@@ -134,10 +134,11 @@ class FileProcessor:
         if warning_flags_path:
             size_ok, size_error = self._validate_file_size(warning_flags_path)
             if size_ok:
-                job_files.warning_flags_path = warning_flags_path
+                paths["warning_flags_path"] = warning_flags_path
             else:
                 errors.append(f"Warning flags file: {size_error}")
 
+        job_files = JobFiles(job_name=job_name, **paths)
         return job_files, errors
 
     def process_candidate_intake(
@@ -206,21 +207,23 @@ class FileProcessor:
         candidate_groups = self._group_files_by_candidate(candidate_files)
 
         for candidate_name, files in candidate_groups.items():
-            candidate_file = CandidateFiles(candidate_name=candidate_name)
+            paths = {}
 
             # Validate file sizes and assign paths
             for file_type, file_path in files.items():
                 size_ok, size_error = self._validate_file_size(file_path)
                 if size_ok:
                     if file_type == "resume":
-                        candidate_file.resume_path = file_path
+                        paths["resume_path"] = file_path
                     elif file_type == "coverletter":
-                        candidate_file.cover_letter_path = file_path
+                        paths["cover_letter_path"] = file_path
                     elif file_type == "application":
-                        candidate_file.application_path = file_path
+                        paths["application_path"] = file_path
                 else:
                     errors.append(f"{candidate_name} - {file_type}: {size_error}")
 
+            candidate_file = CandidateFiles(candidate_name=candidate_name, **paths)
+
             # Ensure each candidate has at least a resume
             if candidate_file.resume_path:
                 candidates.append(candidate_file)
@@ -906,18 +909,26 @@ class FileProcessor:
         best_match = None
         best_ratio = 0.0
 
-        for prefix in expected_prefixes:
-            # Check similarity with the start of filename
-            filename_start = filename.split("_")[
-                0
-            ].lower()  # Get first part before underscore
-            prefix_base = prefix[:-1].lower()  # Remove underscore from prefix
-
-            ratio = difflib.SequenceMatcher(None, prefix_base, filename_start).ratio()
+        # Compare the first part before the underscore against each prefix.
+        # SequenceMatcher caches its analysis of the second sequence, so set
+        # the filename once and swap prefixes in as the first sequence.
+        filename_start = filename.split("_")[0].lower()
+        matcher = difflib.SequenceMatcher(None, "", filename_start)
 
-            # print("   DEBUG: {} vs {} = {:.2f}".format(prefix_base, filename_start, ratio))  # Debug disabled
+        for prefix in expected_prefixes:
+            matcher.set_seq1(prefix[:-1].lower())  # Remove underscore from prefix
+
+            # Must beat the best so far and the 60% similarity threshold; the
+            # cheap upper bounds rule most prefixes out before ratio()
+            threshold = max(best_ratio, 0.6)
+            if (
+                matcher.real_quick_ratio() <= threshold
+                or matcher.quick_ratio() <= threshold
+            ):
+                continue
 
-            if ratio > best_ratio and ratio > 0.6:  # 60% similarity threshold
+            ratio = matcher.ratio()
+            if ratio > threshold:
                 best_match = prefix
                 best_ratio = ratio
 
@@ -999,7 +1010,7 @@ class FileProcessor:
         Returns:
             Dictionary mapping candidate_name -> { file_type: file_path }
         """
-        candidates: Dict[str, Dict[str, Tuple[str, float]]] = {}
+        candidates: Dict[str, Dict[str, Tuple[str, Optional[float]]]] = {}
         duplicates_detected: Dict[str, set] = {}
 
         for file_path, file_type in candidate_files.items():
@@ -1106,7 +1117,7 @@ class FileProcessor:
 
     def _handle_duplicate_files(
         self,
-        candidates: Dict[str, Dict[str, Tuple[str, float]]],
+        candidates: Dict[str, Dict[str, Tuple[str, Optional[float]]]],
         duplicates_detected: Dict[str, set],
         candidate_name: str,
         norm_type: str,
@@ -1125,21 +1136,25 @@ class FileProcessor:
             candidates[candidate_name] = {}
             duplicates_detected[candidate_name] = set()
 
-        mtime = os.path.getmtime(file_path)
-
         if norm_type not in candidates[candidate_name]:
-            candidates[candidate_name][norm_type] = (file_path, mtime)
+            # Grouping is name-based; only stat files once a duplicate shows up
+            candidates[candidate_name][norm_type] = (file_path, None)
         else:
             # Duplicate type - keep newest
             existing_path, existing_mtime = candidates[candidate_name][norm_type]
+            if existing_mtime is None:
+                existing_mtime = os.path.getmtime(existing_path)
+            mtime = os.path.getmtime(file_path)
             if mtime >= existing_mtime:
                 candidates[candidate_name][norm_type] = (file_path, mtime)
+            else:
+                candidates[candidate_name][norm_type] = (existing_path, existing_mtime)
             # Record that we merged this type
             duplicates_detected[candidate_name].add(norm_type)
 
     def _format_grouping_results(
         self,
-        candidates: Dict[str, Dict[str, Tuple[str, float]]],
+        candidates: Dict[str, Dict[str, Tuple[str, Optional[float]]]],
         duplicates_detected: Dict[str, set],
     ) -> Dict[str, Dict[str, str]]:
         """Format the final results and report any duplicates found.
@@ -0,0 +1,71 @@
+"""JSON encoding and decoding helpers with an optional orjson fast path."""
+
+import json
+from datetime import datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# True when the Rust-backed orjson encoder/decoder is available
+USE_ORJSON = orjson is not None
+
+
+def _default(value: Any) -> Any:
+    """Serialize values the stdlib encoder does not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data to indented JSON text.
+
+    Datetime values are written as ISO 8601 strings, so model dictionaries
+    built with ``to_dict(native_datetimes=True)`` can be passed straight in.
+
+    Args:
+        data: JSON-compatible data, optionally containing datetimes
+
+    Returns:
+        JSON document as a string
+    """
+    if USE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_default)
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 encoded JSON.
+
+    Same output as json_dumps, for files opened in binary mode; skips the
+    decode/encode round trip when orjson is available.
+
+    Args:
+        data: JSON-compatible data, optionally containing datetimes
+
+    Returns:
+        JSON document as UTF-8 bytes
+    """
+    if USE_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json_dumps(data).encode("utf-8")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If the document is not valid JSON or not valid UTF-8
+    """
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,10 +1,20 @@
 """Data models for AI Job Candidate Reviewer."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
+# dataclass(slots=True) is only available on Python 3.10+; older interpreters
+# fall back to regular instances with a __dict__.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _make_id(prefix: str, moment: Optional[datetime] = None) -> str:
+    """Build a timestamped record id such as ``eval_20250101_120000``."""
+    return f"{prefix}_{(moment or datetime.now()).strftime('%Y%m%d_%H%M%S')}"
+
 
 class RecommendationType(Enum):
     """Recommendation types for candidate evaluation."""
@@ -109,12 +119,20 @@ class Evaluation:
     detailed_notes: str
     timestamp: datetime = field(default_factory=datetime.now)
     ai_insights_used: Optional[str] = None  # Insights applied during evaluation
-    evaluation_id: str = field(
-        default_factory=lambda: f"eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
+    evaluation_id: str = ""  # Derived from timestamp when not provided
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
+    def __post_init__(self):
+        """Derive the id from the timestamp so both share one clock read."""
+        if not self.evaluation_id:
+            self.evaluation_id = _make_id("eval", self.timestamp)
+
+    def to_dict(self, native_datetimes: bool = False) -> Dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            native_datetimes: Keep datetime objects instead of ISO strings, for
+                encoders that serialize them directly (see json_utils.json_dumps)
+        """
         return {
             "evaluation_id": self.evaluation_id,
             "candidate_name": self.candidate_name,
@@ -125,7 +143,9 @@ class Evaluation:
             "concerns": self.concerns,
             "interview_priority": self.interview_priority.value,
             "detailed_notes": self.detailed_notes,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": (
+                self.timestamp if native_datetimes else self.timestamp.isoformat()
+            ),
             "ai_insights_used": self.ai_insights_used,
         }
 
@@ -133,9 +153,7 @@ class Evaluation:
     def from_dict(cls, data: Dict) -> "Evaluation":
         """Create instance from dictionary."""
         return cls(
-            evaluation_id=data.get(
-                "evaluation_id", f"eval_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            ),
+            evaluation_id=data.get("evaluation_id", ""),
             candidate_name=data["candidate_name"],
             job_name=data["job_name"],
             overall_score=data["overall_score"],
@@ -161,12 +179,20 @@ class HumanFeedback:
         default_factory=dict
     )  # field -> corrected_value
     timestamp: datetime = field(default_factory=datetime.now)
-    feedback_id: str = field(
-        default_factory=lambda: f"feedback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
+    feedback_id: str = ""  # Derived from timestamp when not provided
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
+    def __post_init__(self):
+        """Derive the id from the timestamp so both share one clock read."""
+        if not self.feedback_id:
+            self.feedback_id = _make_id("feedback", self.timestamp)
+
+    def to_dict(self, native_datetimes: bool = False) -> Dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            native_datetimes: Keep datetime objects instead of ISO strings, for
+                encoders that serialize them directly (see json_utils.json_dumps)
+        """
         return {
             "feedback_id": self.feedback_id,
             "evaluation_id": self.evaluation_id,
@@ -174,16 +200,16 @@ class HumanFeedback:
             "human_score": self.human_score,
             "feedback_notes": self.feedback_notes,
             "specific_corrections": self.specific_corrections,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": (
+                self.timestamp if native_datetimes else self.timestamp.isoformat()
+            ),
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "HumanFeedback":
         """Create instance from dictionary."""
         return cls(
-            feedback_id=data.get(
-                "feedback_id", f"feedback_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            ),
+            feedback_id=data.get("feedback_id", ""),
             evaluation_id=data["evaluation_id"],
             human_recommendation=RecommendationType(data["human_recommendation"]),
             human_score=data.get("human_score"),
@@ -204,18 +230,28 @@ class JobInsights:
     effectiveness_metrics: Dict[str, float] = field(
         default_factory=dict
     )  # accuracy improvements, etc.
-    insights_id: str = field(
-        default_factory=lambda: f"insights_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
+    insights_id: str = ""  # Derived from last_updated when not provided
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
+    def __post_init__(self):
+        """Derive the id from the timestamp so both share one clock read."""
+        if not self.insights_id:
+            self.insights_id = _make_id("insights", self.last_updated)
+
+    def to_dict(self, native_datetimes: bool = False) -> Dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            native_datetimes: Keep datetime objects instead of ISO strings, for
+                encoders that serialize them directly (see json_utils.json_dumps)
+        """
         return {
             "insights_id": self.insights_id,
             "job_name": self.job_name,
             "generated_insights": self.generated_insights,
             "feedback_count": self.feedback_count,
-            "last_updated": self.last_updated.isoformat(),
+            "last_updated": (
+                self.last_updated if native_datetimes else self.last_updated.isoformat()
+            ),
             "effectiveness_metrics": self.effectiveness_metrics,
         }
 
@@ -223,9 +259,7 @@ class JobInsights:
     def from_dict(cls, data: Dict) -> "JobInsights":
         """Create instance from dictionary."""
         return cls(
-            insights_id=data.get(
-                "insights_id", f"insights_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            ),
+            insights_id=data.get("insights_id", ""),
             job_name=data["job_name"],
             generated_insights=data["generated_insights"],
             feedback_count=data["feedback_count"],
@@ -243,18 +277,26 @@ class FeedbackRecord:
     original_evaluation: Evaluation
     human_feedback: HumanFeedback
     insights_generated: Optional[str] = None
-    record_id: str = field(
-        default_factory=lambda: f"record_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    )
+    record_id: str = ""  # Generated at construction when not provided
 
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
+    def __post_init__(self):
+        """Generate a record id when none was provided."""
+        if not self.record_id:
+            self.record_id = _make_id("record")
+
+    def to_dict(self, native_datetimes: bool = False) -> Dict:
+        """Convert to dictionary for JSON serialization.
+
+        Args:
+            native_datetimes: Keep datetime objects instead of ISO strings, for
+                encoders that serialize them directly (see json_utils.json_dumps)
+        """
         return {
             "record_id": self.record_id,
             "candidate_name": self.candidate_name,
             "job_name": self.job_name,
-            "original_evaluation": self.original_evaluation.to_dict(),
-            "human_feedback": self.human_feedback.to_dict(),
+            "original_evaluation": self.original_evaluation.to_dict(native_datetimes),
+            "human_feedback": self.human_feedback.to_dict(native_datetimes),
             "insights_generated": self.insights_generated,
         }
 
@@ -262,9 +304,7 @@ class FeedbackRecord:
     def from_dict(cls, data: Dict) -> "FeedbackRecord":
         """Create instance from dictionary."""
         return cls(
-            record_id=data.get(
-                "record_id", f"record_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            ),
+            record_id=data.get("record_id", ""),
             candidate_name=data["candidate_name"],
             job_name=data["job_name"],
             original_evaluation=Evaluation.from_dict(data["original_evaluation"]),
@@ -273,7 +313,7 @@ class FeedbackRecord:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class JobSetupResult:
     """Result of job setup operation."""
 
@@ -284,7 +324,7 @@ class JobSetupResult:
     errors: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProcessingResult:
     """Result of candidate processing operation."""
 
@@ -297,7 +337,7 @@ class ProcessingResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DisplayResult:
     """Result of candidate display operation."""
 
@@ -307,7 +347,7 @@ class DisplayResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ConnectionResult:
     """Result of API connection test."""
 
@@ -317,7 +357,7 @@ class ConnectionResult:
     model_info: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class APIResponse:
     """Response from OpenAI API."""
 
@@ -328,7 +368,7 @@ class APIResponse:
     response_time_ms: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CandidateFiles:
     """Files associated with a candidate."""
 
@@ -337,19 +377,23 @@ class CandidateFiles:
     cover_letter_path: Optional[str] = None
     application_path: Optional[str] = None
 
+    # file_type -> attribute holding its path, in output order
+    _FIELDS = (
+        ("resume", "resume_path"),
+        ("cover_letter", "cover_letter_path"),
+        ("application", "application_path"),
+    )
+
     def get_file_paths(self) -> Dict[str, str]:
         """Get non-None file paths as dictionary."""
-        paths = {}
-        if self.resume_path:
-            paths["resume"] = self.resume_path
-        if self.cover_letter_path:
-            paths["cover_letter"] = self.cover_letter_path
-        if self.application_path:
-            paths["application"] = self.application_path
-        return paths
+        return {
+            file_type: path
+            for file_type, attr in self._FIELDS
+            if (path := getattr(self, attr))
+        }
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class JobFiles:
     """Files associated with a job setup."""
 
@@ -1,11 +1,32 @@
 #!/usr/bin/env python3
 """Monitor GPT-5 availability and test when ready."""
 
+import random
 import time
 
 from config import Config
 from open_api_test_connection import OpenAIConnectionTester
 
+# Polling interval while the API is reachable but GPT-5 is not yet listed
+POLL_INTERVAL_SECONDS = 30
+# Upper bound for the exponential backoff applied after failed attempts
+MAX_BACKOFF_SECONDS = 300
+# Random jitter added to every sleep so parallel monitors don't synchronize
+MAX_JITTER_SECONDS = 2
+
+
+def _next_delay(consecutive_failures: int) -> float:
+    """Compute the sleep before the next attempt.
+
+    Args:
+        consecutive_failures: Number of failed attempts in a row
+
+    Returns:
+        Delay in seconds, doubling per failure up to MAX_BACKOFF_SECONDS
+    """
+    delay = min(MAX_BACKOFF_SECONDS, POLL_INTERVAL_SECONDS * 2**consecutive_failures)
+    return delay + random.uniform(0, MAX_JITTER_SECONDS)
+
 
 def monitor_gpt5_access():
     """Monitor GPT-5 access until available."""
@@ -13,34 +34,59 @@ def monitor_gpt5_access():
     config = Config()
 
     print("🔍 Monitoring GPT-5 access...")
-    print("Will check every 30 seconds until GPT-5 is available")
+    print(
+        f"Will check every {POLL_INTERVAL_SECONDS} seconds until GPT-5 is available "
+        f"(backing off up to {MAX_BACKOFF_SECONDS} seconds on errors)"
+    )
     print("Press Ctrl+C to stop monitoring\n")
 
     attempt = 1
+    consecutive_failures = 0
+    tester = None
 
     while True:
         try:
             print(f"📡 Attempt {attempt}: Testing GPT-5 access...")
 
-            # Test connection with GPT-5 preferred
-            tester = OpenAIConnectionTester(config.openai_api_key, "gpt-5")
-            result = tester.test_connection()
-
-            if result.success and tester.model.startswith("gpt-5"):
-                print("🎉 SUCCESS! GPT-5 is now available!")
-                print(f"   Using model: {tester.model}")
-                print(f"   Response time: {result.response_time_ms:.0f}ms")
-                print("\n✅ Your system will now automatically use GPT-5!")
-                break
+            # Build the tester once; later attempts only refresh the model list
+            models_listed = True
+            if tester is None:
+                tester = OpenAIConnectionTester(config.openai_api_key, "gpt-5")
             else:
-                current_model = tester.model
+                models_listed = bool(tester.refresh_available_models())
+                # Reselect every time so a lost model (or none at all) can fall
+                # back; models verified recently are not probed again
+                tester.reselect_model()
+
+            current_model = tester.model or ""
+            if (
+                models_listed
+                and current_model
+                and not current_model.startswith("gpt-5")
+            ):
+                # Connection works but GPT-5 is not accessible yet: skip the probe
                 print(f"⏳ Still waiting... Currently using: {current_model}")
+                consecutive_failures = 0
+            else:
+                result = tester.test_connection()
+
+                if result.success and current_model.startswith("gpt-5"):
+                    print("🎉 SUCCESS! GPT-5 is now available!")
+                    print(f"   Using model: {tester.model}")
+                    print(f"   Response time: {result.response_time_ms:.0f}ms")
+                    print("\n✅ Your system will now automatically use GPT-5!")
+                    break
 
-                if not result.success:
+                print(f"⏳ Still waiting... Currently using: {tester.model}")
+                if result.success:
+                    consecutive_failures = 0
+                else:
                     print(f"   Error: {result.message}")
+                    consecutive_failures += 1
 
-            print("   Next check in 30 seconds...\n")
-            time.sleep(30)
+            delay = _next_delay(consecutive_failures)
+            print(f"   Next check in {delay:.0f} seconds...\n")
+            time.sleep(delay)
             attempt += 1
 
         except KeyboardInterrupt:
@@ -48,7 +94,8 @@ def monitor_gpt5_access():
             break
         except Exception as e:
             print(f"❌ Error during monitoring: {e}")
-            time.sleep(30)
+            consecutive_failures += 1
+            time.sleep(_next_delay(consecutive_failures))
 
 
 if __name__ == "__main__":
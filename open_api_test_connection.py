@@ -1,13 +1,24 @@
 """OpenAI API connection testing and model selection."""
 
+import hashlib
+import json
 import time
-from typing import List, Optional
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import openai
 from openai import OpenAI
 
 from models import ConnectionResult
 
+# Models that passed an availability probe, keyed by a hash of the API key
+PROBE_CACHE_PATH = Path.home() / ".cache" / "ai_job_reviewer" / "model_probes.json"
+# How long a successful probe is trusted before the model is probed again
+PROBE_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Model families this project is allowed to use
+MODEL_FAMILIES = ("gpt-5", "gpt-4")
+
 
 class OpenAIConnectionTester:
     """OpenAI API connection testing and model selection."""
@@ -22,6 +33,10 @@ class OpenAIConnectionTester:
         self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
 
+        # Never store the key itself; a short digest is enough to scope the cache
+        self._probe_cache_key = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self._probe_cache = self._load_probe_cache()
+
         # Model priority list - Prefer GPT-5, then GPT-4 variants that are allowed for this project
         # Note: We intentionally exclude GPT-4o family if the project does not have access
         model_priority = [
@@ -35,9 +50,52 @@ class OpenAIConnectionTester:
 
         if preferred_model:
             model_priority.insert(0, preferred_model)
+        # Drop repeats (e.g. a preferred model already in the list), keeping order
+        self.model_priority = list(dict.fromkeys(model_priority))
+
+        # Fetch the model list once; callers refresh it explicitly when needed
+        self._available_models: List[str] = []
+        self._models_by_prefix: Dict[str, List[str]] = {}
+        self._refresh_models()
 
         # Use model selection with fallback limited to accessible models
-        self.model = self._select_best_available_model(model_priority)
+        self.model = self._select_best_available_model(self.model_priority)
+
+    def _refresh_models(self) -> List[str]:
+        """Re-fetch the available model list from the API.
+
+        Returns:
+            Refreshed list of available model names
+        """
+        self._available_models = self.get_available_models()
+
+        # Index model ids by priority prefix in one pass over the list
+        self._models_by_prefix = {prefix: [] for prefix in self.model_priority}
+        for model in self._available_models:
+            for prefix in self._models_by_prefix:
+                if model.startswith(prefix):
+                    self._models_by_prefix[prefix].append(model)
+
+        return self._available_models
+
+    def refresh_available_models(self) -> List[str]:
+        """Re-fetch the available model list, e.g. from a long-running monitor.
+
+        Returns:
+            Refreshed list of available model names
+        """
+        return self._refresh_models()
+
+    def reselect_model(self) -> Optional[str]:
+        """Re-run model selection against the current model list.
+
+        Models verified within PROBE_CACHE_TTL_SECONDS are not probed again.
+
+        Returns:
+            Newly selected model name, or None if none are accessible
+        """
+        self.model = self._select_best_available_model(self.model_priority)
+        return self.model
 
     def _select_best_available_model(self, model_priority: List[str]) -> Optional[str]:
         """Select the best available model from priority list.
@@ -48,29 +106,26 @@ class OpenAIConnectionTester:
         Returns:
             Name of the best available model, or None if none are accessible
         """
-        available_models = self.get_available_models()
+        available_models = self._available_models
 
-        # Helper to iterate over available ids matching a prefix or exact id
+        # Available ids matching a prefix (or exact id), indexed on refresh
         def candidates_for(preferred: str) -> List[str]:
-            return [
-                m for m in available_models if m == preferred or m.startswith(preferred)
-            ]
-
-        # Try preferred model first if provided
-        if model_priority and len(model_priority) > 0:
-            pass  # kept for readability
-
-        # Try each priority prefix against available model ids
-        for pref in model_priority:
-            for candidate in candidates_for(pref):
-                if self._test_model_availability(candidate):
-                    return candidate
-
-        # As a last attempt, try any available GPT-5/4 model ids
-        for candidate in available_models:
-            if candidate.startswith(("gpt-5", "gpt-4")):
-                if self._test_model_availability(candidate):
-                    return candidate
+            indexed = self._models_by_prefix.get(preferred)
+            if indexed is not None:
+                return indexed
+            return [m for m in available_models if m.startswith(preferred)]
+
+        # One ordered pass: priority prefixes first, then any other GPT-5/4 id
+        # as a last attempt. Each model id is probed at most once.
+        ordered_candidates = dict.fromkeys(
+            chain(
+                chain.from_iterable(candidates_for(pref) for pref in model_priority),
+                (m for m in available_models if m.startswith(MODEL_FAMILIES)),
+            )
+        )
+        for candidate in ordered_candidates:
+            if self._test_model_availability(candidate):
+                return candidate
 
         # No accessible model found
         return None
@@ -78,12 +133,19 @@ class OpenAIConnectionTester:
     def _test_model_availability(self, model: str) -> bool:
         """Test if a model is available for use.
 
+        Models verified within PROBE_CACHE_TTL_SECONDS are trusted without
+        another (billed) probe request.
+
         Args:
             model: Model name to test
 
         Returns:
             True if model is available, False otherwise
         """
+        verified_at = self._probe_cache.get(self._probe_cache_key, {}).get(model)
+        if verified_at and time.time() - verified_at < PROBE_CACHE_TTL_SECONDS:
+            return True
+
         try:
             # Make a minimal test call with proper parameters for each model
             request_params = {
@@ -99,10 +161,67 @@ class OpenAIConnectionTester:
                 request_params["max_tokens"] = 1
 
             self.client.chat.completions.create(**request_params)
-            return True
+        except (openai.AuthenticationError, openai.NotFoundError):
+            self._invalidate_probe_cache(model)
+            return False
         except Exception:
             return False
 
+        self._probe_cache.setdefault(self._probe_cache_key, {})[model] = time.time()
+        self._save_probe_cache()
+        return True
+
+    def _load_probe_cache(self) -> Dict[str, Dict[str, float]]:
+        """Load the on-disk probe cache.
+
+        Returns:
+            Mapping of API key digest -> {model id: verification time}
+        """
+        try:
+            with open(PROBE_CACHE_PATH, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+
+        # Drop anything a hand edit or older format left behind; a dropped
+        # entry only costs a future probe
+        return {
+            key_digest: {
+                model: verified_at
+                for model, verified_at in entries.items()
+                if isinstance(verified_at, (int, float))
+                and not isinstance(verified_at, bool)
+            }
+            for key_digest, entries in cache.items()
+            if isinstance(entries, dict)
+        }
+
+    def _save_probe_cache(self) -> None:
+        """Persist the probe cache; failures only cost a future probe."""
+        try:
+            PROBE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(PROBE_CACHE_PATH, "w", encoding="utf-8") as f:
+                json.dump(self._probe_cache, f, indent=2)
+        except OSError:
+            pass
+
+    def _invalidate_probe_cache(self, model: Optional[str] = None) -> None:
+        """Forget cached probe results for this API key.
+
+        Args:
+            model: Only forget this model; forget every model when None
+        """
+        entries = self._probe_cache.get(self._probe_cache_key)
+        if not entries:
+            return
+        if model is None:
+            del self._probe_cache[self._probe_cache_key]
+        elif entries.pop(model, None) is None:
+            return
+        self._save_probe_cache()
+
     def get_available_models(self) -> List[str]:
         """Get list of available models for this API key.
 
@@ -113,7 +232,7 @@ class OpenAIConnectionTester:
             models = self.client.models.list()
             ids = [model.id for model in models.data if "gpt" in model.id.lower()]
             # Prefer only GPT-5 and GPT-4 families, exclude GPT-4o family unless explicitly allowed
-            filtered = [m for m in ids if m.startswith(("gpt-5", "gpt-4"))]
+            filtered = [m for m in ids if m.startswith(MODEL_FAMILIES)]
             return filtered or ids
         except Exception:
             return []
@@ -129,7 +248,7 @@ class OpenAIConnectionTester:
         try:
             # Validate model selection
             if not self.model:
-                available_models = self.get_available_models()
+                available_models = self._available_models
                 return ConnectionResult(
                     success=False,
                     message=(
@@ -164,7 +283,7 @@ class OpenAIConnectionTester:
 
             # Validate response
             if response.choices and response.choices[0].message.content:
-                available_models = self.get_available_models()
+                available_models = self._available_models
                 model_info = f"Using: {self.model}"
                 if len(available_models) > 0:
                     model_info += f" (Available GPT models: {len(available_models)})"
@@ -180,10 +299,17 @@ class OpenAIConnectionTester:
             )
 
         except openai.AuthenticationError:
+            self._invalidate_probe_cache()
             return ConnectionResult(
                 success=False,
                 message="Authentication failed. Please check your API key.",
             )
+        except openai.NotFoundError:
+            self._invalidate_probe_cache(self.model)
+            return ConnectionResult(
+                success=False,
+                message=f"Model {self.model} is no longer available for this project.",
+            )
         except openai.RateLimitError:
             return ConnectionResult(
                 success=False, message="Rate limit exceeded. Please try again later."
@@ -233,7 +359,7 @@ def main():
 
         # Show available models
         print("\n📋 Available GPT Models:")
-        models = tester.get_available_models()
+        models = tester._available_models
         if models:
             for i, model in enumerate(sorted(models)[:10], 1):  # Show first 10
                 current = " (CURRENT)" if model == tester.model else ""
@@ -1,14 +1,262 @@
 """Output generation for AI Job Candidate Reviewer."""
 
 import csv
-import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from html import escape
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from string import Template
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from config import Config
+from json_utils import json_dumps_bytes, json_loads
 from models import Evaluation, InterviewPriority, JobContext, RecommendationType
 
+# Jobs with fewer candidate directories than this are read serially
+PARALLEL_LOAD_MIN_CANDIDATES = 32
+
+# Prefix of DUPLICATE_WARNING.txt read for the report summary
+DUPLICATE_WARNING_READ_CHARS = 512
+
+# Buffer size for report files, so large reports are flushed in few writes
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Column order of the candidate scores CSV; rows are tuples in this order
+CSV_FIELDNAMES = (
+    "Rank",
+    "Status",
+    "Candidate Name",
+    "Overall Score",
+    "Recommendation",
+    "Interview Priority",
+    "Strengths",
+    "Concerns",
+    "Detailed Notes",
+    "Evaluation Date",
+    "AI Insights Used",
+    "Flags",
+)
+
+# ANSI color per recommendation in terminal output
+REC_COLORS = {
+    RecommendationType.STRONG_YES: "\033[92m",  # Green
+    RecommendationType.YES: "\033[94m",  # Blue
+    RecommendationType.MAYBE: "\033[93m",  # Yellow
+    RecommendationType.NO: "\033[91m",  # Red
+    RecommendationType.STRONG_NO: "\033[95m",  # Magenta
+}
+
+# Terminal output without colors, for when stdout is not a TTY
+ANSI_RESET = "\033[0m"
+NO_REC_COLORS = {rec: "" for rec in RecommendationType}
+
+# CSS class per recommendation in the HTML report (e.g. STRONG_YES -> strong-yes)
+REC_HTML_CLASSES = {
+    rec: rec.value.lower().replace("_", "-") for rec in RecommendationType
+}
+
+# Recommendations counted as strong candidates in summary statistics
+STRONG_RECOMMENDATIONS = frozenset(
+    (RecommendationType.STRONG_YES, RecommendationType.YES)
+)
+
+# Icon per interview priority in terminal output
+PRIORITY_ICONS = {
+    InterviewPriority.HIGH: "🔥",
+    InterviewPriority.MEDIUM: "📋",
+    InterviewPriority.LOW: "📝",
+}
+
+# HTML report building blocks, parsed once at import. Substituted values are
+# HTML-escaped by the caller (see _iter_html_parts).
+HTML_HEAD = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Candidate Evaluation Report - $job_name</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
+        .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; margin-bottom: 20px; }
+        .stats { background-color: #e8f4fd; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+        .candidate { border: 1px solid #ddd; margin-bottom: 20px; padding: 15px; border-radius: 5px; }
+        .candidate h3 { margin-top: 0; color: #333; }
+        .score { font-size: 1.2em; font-weight: bold; }
+        .recommendation { padding: 5px 10px; border-radius: 3px; color: white; }
+        .strong-yes { background-color: #28a745; }
+        .yes { background-color: #007bff; }
+        .maybe { background-color: #ffc107; color: black; }
+        .no { background-color: #dc3545; }
+        .strong-no { background-color: #6f42c1; }
+        .strengths { color: #28a745; }
+        .concerns { color: #dc3545; }
+        ul { margin: 5px 0; }
+        .duplicate-banner { background-color: #ffe3e3; color: #b00020; padding: 8px 12px; border-radius: 4px; margin: 8px 0; font-weight: bold; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Candidate Evaluation Report</h1>
+        <h2>$job_name</h2>
+        <p><strong>Generated:</strong> $generated</p>
+    </div>
+""")
+
+HTML_SUMMARY_STATS = Template("""
+    <div class="stats">
+        <h3>Summary Statistics</h3>
+        <p><strong>Total Candidates:</strong> $total_candidates</p>
+        <p><strong>Average Score:</strong> $average_score</p>
+        <p><strong>Score Range:</strong> $lowest_score - $highest_score</p>
+        <p><strong>Strong Candidates:</strong> $strong_candidates</p>
+        <p><strong>High Priority Interviews:</strong> $high_priority_interviews</p>
+    </div>
+""")
+
+HTML_CANDIDATE_HEADER = Template("""
+    <div class="candidate">
+        <h3>$rank. $candidate_name$duplicate_tag</h3>
+        <p>
+            <span class="score">Score: $score/100</span> |
+            <span class="recommendation $rec_class">$recommendation</span> |
+            <strong>Priority:</strong> $priority
+        </p>
+""")
+
+HTML_DUPLICATE_BANNER = Template("""
+        <div class="duplicate-banner">
+            🚨 Duplicate identifiers detected. $banner
+        </div>
+""")
+
+HTML_ITEM_LIST = Template("""
+        <div class="$css_class">
+            <strong>$title:</strong>
+            <ul>
+                $items
+            </ul>
+        </div>
+""")
+
+HTML_CANDIDATE_FOOTER = Template("""
+        <p><strong>Detailed Notes:</strong> $detailed_notes</p>
+        <p><small><strong>Evaluated:</strong> $evaluated</small></p>
+    </div>
+""")
+
+HTML_REJECTED_CANDIDATE = Template("""
+    <div class="candidate">
+        <h3>$candidate_name</h3>
+        <p>
+            <span class="score">Score: $score/100</span> |
+            <span class="recommendation $rec_class">$recommendation</span>
+        </p>
+        <p><strong>Reason:</strong> $reason</p>
+        <p><small><strong>Evaluated:</strong> $evaluated</small></p>
+    </div>
+""")
+
+
+def _sort_by_score(evaluations: List[Evaluation]) -> List[Evaluation]:
+    """Sort evaluations by score, highest first.
+
+    The sort is stable and linear on input that is already in score order
+    (as returned by load_evaluations_for_job), so callers can sort
+    defensively without paying for it twice.
+
+    Args:
+        evaluations: Evaluations in any order
+
+    Returns:
+        New list ordered by descending score
+    """
+    return sorted(evaluations, key=attrgetter("overall_score"), reverse=True)
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """Format a naive timestamp as ``YYYY-MM-DD HH:MM:SS``.
+
+    Equivalent to strftime("%Y-%m-%d %H:%M:%S") for naive datetimes, but
+    isoformat skips the locale-aware strftime path.
+
+    Args:
+        timestamp: Naive datetime to format
+
+    Returns:
+        Formatted timestamp string
+    """
+    return timestamp.isoformat(sep=" ", timespec="seconds")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_candidate_name(name: str) -> str:
+    """Normalize candidate name for deduplication.
+
+    Pure and called for every pairing during deduplication and rejection
+    lookups, so results are memoized.
+
+    Args:
+        name: Original candidate name
+
+    Returns:
+        Normalized name for comparison
+    """
+    # Convert to lowercase for comparison
+    normalized = name.lower()
+
+    # Remove common suffixes that indicate file types
+    type_suffixes = ["_resume", "_application", "_cover", "_coverletter"]
+    for suffix in type_suffixes:
+        if normalized.endswith(suffix):
+            normalized = normalized[: -len(suffix)]
+            break
+
+    # Split into parts for more sophisticated matching
+    parts = normalized.split("_")
+    parts = [part for part in parts if part]  # Remove empty parts
+
+    if not parts:
+        return normalized
+
+    # For single part names, check if it could be a last name
+    if len(parts) == 1:
+        single_part = parts[0]
+        # This will be used to match against multi-part names containing this part
+        return single_part
+
+    # For multi-part names, create multiple possible matches
+    # This handles firstname_lastname, lastname_firstname, etc.
+    if len(parts) >= 2:
+        # Primary key: sort all parts for consistent ordering
+        primary_key = "_".join(sorted(parts))
+        return primary_key
+
+    return normalized
+
+
+class JobCandidateRecord(NamedTuple):
+    """Files read from one candidate directory of a job."""
+
+    name: str
+    evaluation: Optional[dict] = None  # Parsed evaluation.json
+    meta: Optional[dict] = None  # Parsed candidate_meta.json
+    duplicate_snippet: Optional[str] = None  # Summary of DUPLICATE_WARNING.txt
+
 
 class OutputGenerator:
     """Generate CSV reports and terminal displays for candidate evaluations."""
@@ -20,6 +268,22 @@ class OutputGenerator:
             config: Configuration object
         """
         self.config = config
+        # Rejection metadata and duplicate flags per job, shared by the CSV,
+        # HTML and terminal reports; see invalidate_job_cache
+        self._report_context_cache: Dict[
+            str, Tuple[Dict[str, dict], Dict[str, str]]
+        ] = {}
+
+    def invalidate_job_cache(self, job_name: Optional[str] = None) -> None:
+        """Forget cached report context after candidate files change.
+
+        Args:
+            job_name: Job whose candidates changed, or None to forget all jobs
+        """
+        if job_name is None:
+            self._report_context_cache.clear()
+        else:
+            self._report_context_cache.pop(job_name, None)
 
     def generate_csv(
         self, evaluations: List[Evaluation], output_path: str, job_name: str
@@ -43,54 +307,66 @@ class OutputGenerator:
         csv_path = Path(output_path) / csv_filename
 
         # Sort evaluations by score (descending)
-        sorted_evaluations = sorted(
-            evaluations, key=lambda e: e.overall_score, reverse=True
-        )
-
-        # Prepare duplicate flags
-        duplicate_flags = self._load_duplicate_warnings(job_name)
+        sorted_evaluations = _sort_by_score(evaluations)
+
+        # Prepare duplicate flags and rejection status
+        rejected_meta, duplicate_flags = self._load_report_context(job_name)
+        rejected_map = self._resolve_rejections(sorted_evaluations, rejected_meta)
+
+        # Write CSV file, streaming rows as they are built
+        with open(
+            csv_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as csvfile:
+            if sorted_evaluations:
+                writer = csv.writer(csvfile)
+                writer.writerow(CSV_FIELDNAMES)
+                writer.writerows(
+                    self._iter_csv_rows(
+                        sorted_evaluations, rejected_map, duplicate_flags
+                    )
+                )
 
-        # Prepare CSV data
-        csv_data = []
-        for rank, evaluation in enumerate(sorted_evaluations, 1):
-            flags = []
-            if evaluation.candidate_name in duplicate_flags:
-                flags.append("DUPLICATE_IDENTIFIERS")
+        return str(csv_path)
 
-            # Check rejection status
-            is_rejected = self._is_candidate_rejected(
-                job_name, evaluation.candidate_name
-            )
-            status = "Rejected" if is_rejected else "Active"
-
-            csv_data.append(
-                {
-                    "Rank": rank,
-                    "Status": status,
-                    "Candidate Name": evaluation.candidate_name,
-                    "Overall Score": evaluation.overall_score,
-                    "Recommendation": evaluation.recommendation.value,
-                    "Interview Priority": evaluation.interview_priority.value,
-                    "Strengths": "; ".join(evaluation.strengths),
-                    "Concerns": "; ".join(evaluation.concerns),
-                    "Detailed Notes": evaluation.detailed_notes,
-                    "Evaluation Date": evaluation.timestamp.strftime(
-                        "%Y-%m-%d %H:%M:%S"
-                    ),
-                    "AI Insights Used": evaluation.ai_insights_used or "None",
-                    "Flags": ", ".join(flags) if flags else "",
-                }
-            )
+    def _iter_csv_rows(
+        self,
+        sorted_evaluations: List[Evaluation],
+        rejected_map: Dict[str, dict],
+        duplicate_flags: Dict[str, str],
+    ) -> Iterator[tuple]:
+        """Yield CSV rows ordered as CSV_FIELDNAMES.
 
-        # Write CSV file
-        with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            if csv_data:
-                fieldnames = csv_data[0].keys()
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(csv_data)
+        Args:
+            sorted_evaluations: Evaluations in rank order
+            rejected_map: Rejected candidates from _resolve_rejections
+            duplicate_flags: Duplicate warnings from _load_duplicate_warnings
 
-        return str(csv_path)
+        Yields:
+            One row tuple per evaluation
+        """
+        for rank, evaluation in enumerate(sorted_evaluations, 1):
+            yield (
+                rank,
+                "Rejected" if evaluation.candidate_name in rejected_map else "Active",
+                evaluation.candidate_name,
+                evaluation.overall_score,
+                evaluation.recommendation.value,
+                evaluation.interview_priority.value,
+                "; ".join(evaluation.strengths),
+                "; ".join(evaluation.concerns),
+                evaluation.detailed_notes,
+                _format_timestamp(evaluation.timestamp),
+                evaluation.ai_insights_used or "None",
+                (
+                    "DUPLICATE_IDENTIFIERS"
+                    if evaluation.candidate_name in duplicate_flags
+                    else ""
+                ),
+            )
 
     def display_terminal_ranking(
         self, evaluations: List[Evaluation], job_name: str
@@ -105,69 +381,84 @@ class OutputGenerator:
             print(f"\n📋 No candidates found for job: {job_name}")
             return
 
-        # Separate rejected and active candidates
-        active_evaluations = []
-        rejected_evaluations = []
+        # Build the whole ranking and emit it with one write, rather than
+        # taking the stdout lock for every line. Skip ANSI colors when the
+        # output is piped to a file or CI log.
+        lines = self._terminal_ranking_lines(
+            evaluations, job_name, use_color=sys.stdout.isatty()
+        )
+        sys.stdout.write("\n".join(lines))
+        print()
 
-        for evaluation in evaluations:
-            if self._is_candidate_rejected(job_name, evaluation.candidate_name):
-                rejected_evaluations.append(evaluation)
-            else:
-                active_evaluations.append(evaluation)
+    def _terminal_ranking_lines(
+        self, evaluations: List[Evaluation], job_name: str, use_color: bool = True
+    ) -> List[str]:
+        """Build the terminal ranking output.
 
-        # Sort evaluations by score (descending)
-        sorted_active = sorted(
-            active_evaluations, key=lambda e: e.overall_score, reverse=True
-        )
-        sorted_rejected = sorted(
-            rejected_evaluations, key=lambda e: e.overall_score, reverse=True
+        Args:
+            evaluations: List of candidate evaluations
+            job_name: Name of the job
+            use_color: Include ANSI color codes for recommendations
+
+        Returns:
+            Output lines, without trailing newlines
+        """
+        # Sort once by score (descending), then separate rejected and active
+        # candidates; partitioning keeps both halves in score order
+        sorted_active, sorted_rejected, rejected_map, duplicate_flags = (
+            self._partition_rejected(_sort_by_score(evaluations), job_name)
         )
 
-        # Load duplicate flags
-        duplicate_flags = self._load_duplicate_warnings(job_name)
+        colors = REC_COLORS if use_color else NO_REC_COLORS
+        reset = ANSI_RESET if use_color else ""
 
-        print(f"\n🎯 Candidate Rankings for: {job_name}")
-        print("=" * 80)
+        lines: List[str] = []
+        out = lines.append
+
+        out(f"\n🎯 Candidate Rankings for: {job_name}")
+        out("=" * 80)
 
         # Add explanatory header
-        print("\n📊 How to Read the Results:")
-        print("   Score: [0-100] | [RECOMMENDATION] | [🔥📋📝] [INTERVIEW PRIORITY]")
-        print("")
-        print(
-            "   \033[92mSTRONG_YES\033[0m = Great catch         🔥 HIGH = Interview ASAP"
+        out("\n📊 How to Read the Results:")
+        out("   Score: [0-100] | [RECOMMENDATION] | [🔥📋📝] [INTERVIEW PRIORITY]")
+        out("")
+        out(
+            f"   {colors[RecommendationType.STRONG_YES]}STRONG_YES{reset} = Great catch         🔥 HIGH = Interview ASAP"
+        )
+        out(
+            f"   {colors[RecommendationType.YES]}YES{reset} = Consider hiring            📋 MEDIUM = Not sure. Review again before deciding"
         )
-        print(
-            "   \033[94mYES\033[0m = Consider hiring            📋 MEDIUM = Not sure. Review again before deciding"
+        out(
+            f"   {colors[RecommendationType.MAYBE]}MAYBE{reset} = Consider carefully       📝 LOW = Likely not worth interviewing. Too many red flags"
         )
-        print(
-            "   \033[93mMAYBE\033[0m = Consider carefully       📝 LOW = Likely not worth interviewing. Too many red flags"
+        out(
+            f"   {colors[RecommendationType.NO]}NO{reset}/{colors[RecommendationType.STRONG_NO]}STRONG_NO{reset} = Don't recommend"
         )
-        print("   \033[91mNO\033[0m/\033[95mSTRONG_NO\033[0m = Don't recommend")
-        print("=" * 80)
+        out("=" * 80)
 
         # Display active candidates
         for rank, evaluation in enumerate(sorted_active, 1):
             # Color coding for recommendations
-            rec_color = self._get_recommendation_color(evaluation.recommendation)
-            priority_icon = self._get_priority_icon(evaluation.interview_priority)
+            rec_color = colors[evaluation.recommendation]
+            priority_icon = PRIORITY_ICONS[evaluation.interview_priority]
 
             dup_tag = (
                 " \U0001f6a8 DUPLICATE"
                 if evaluation.candidate_name in duplicate_flags
                 else ""
             )
-            print(f"\n{rank}. {evaluation.candidate_name}{dup_tag}")
-            print(
-                f"   Score: {evaluation.overall_score}/100 | {rec_color}{evaluation.recommendation.value}\033[0m | {priority_icon} {evaluation.interview_priority.value}"
+            out(f"\n{rank}. {evaluation.candidate_name}{dup_tag}")
+            out(
+                f"   Score: {evaluation.overall_score}/100 | {rec_color}{evaluation.recommendation.value}{reset} | {priority_icon} {evaluation.interview_priority.value}"
             )
 
             if evaluation.strengths:
-                print(
+                out(
                     f"   ✅ Strengths: {', '.join(evaluation.strengths[:3])}{'...' if len(evaluation.strengths) > 3 else ''}"
                 )
 
             if evaluation.concerns:
-                print(
+                out(
                     f"   ⚠️  Concerns: {', '.join(evaluation.concerns[:2])}{'...' if len(evaluation.concerns) > 2 else ''}"
                 )
 
@@ -175,70 +466,50 @@ class OutputGenerator:
             if evaluation.candidate_name in duplicate_flags:
                 snippet = duplicate_flags[evaluation.candidate_name]
                 if snippet:
-                    print(f"   🚨 Duplicate identifiers detected: {snippet}")
+                    out(f"   🚨 Duplicate identifiers detected: {snippet}")
 
-        print("\n" + "=" * 80)
+        out("\n" + "=" * 80)
 
         # Summary statistics for active candidates
-        self._display_summary_stats(sorted_active)
+        lines.extend(self._summary_stats_lines(sorted_active))
 
         # Also show AI performance metrics (if insights exist for this job)
-        try:
-            job_dir = Path(self.config.get_job_path(job_name))
-            insights_path = job_dir / "insights.json"
-            if insights_path.exists():
-                with open(insights_path, "r", encoding="utf-8") as f:
-                    insights_data = json.load(f)
-                    metrics = insights_data.get("effectiveness_metrics", {})
-                    if metrics:
-                        print("\n📊 AI Performance:")
-                        print(
-                            f"   Agreement rate: {metrics.get('agreement_rate', 0):.1%}"
-                        )
-                        if "explicit_agreements" in metrics:
-                            print(
-                                f"   Explicit agreements: {metrics.get('explicit_agreements', 0)}"
-                            )
-                        if "explicit_disagreements" in metrics:
-                            print(
-                                f"   Disagreements: {metrics.get('explicit_disagreements', 0)}"
-                            )
-                        if "no_feedback_count" in metrics:
-                            print(
-                                f"   Not yet reviewed/Implicit agreement: {metrics.get('no_feedback_count', 0)}"
-                            )
-                        if "total_candidates" in metrics:
-                            print(
-                                f"   Total candidates: {metrics.get('total_candidates', 0)}"
-                            )
-        except Exception:
-            pass
+        metrics = self._load_insights_metrics(job_name)
+        if metrics:
+            out("\n📊 AI Performance:")
+            out(f"   Agreement rate: {metrics.get('agreement_rate', 0):.1%}")
+            if "explicit_agreements" in metrics:
+                out(f"   Explicit agreements: {metrics.get('explicit_agreements', 0)}")
+            if "explicit_disagreements" in metrics:
+                out(f"   Disagreements: {metrics.get('explicit_disagreements', 0)}")
+            if "no_feedback_count" in metrics:
+                out(
+                    f"   Not yet reviewed/Implicit agreement: {metrics.get('no_feedback_count', 0)}"
+                )
+            if "total_candidates" in metrics:
+                out(f"   Total candidates: {metrics.get('total_candidates', 0)}")
 
         # Display rejected candidates section if there are any
         if sorted_rejected:
-            print("\n" + "─" * 80)
-            print(f"🚫 REJECTED CANDIDATES ({len(sorted_rejected)})")
-            print("─" * 80)
+            out("\n" + "─" * 80)
+            out(f"🚫 REJECTED CANDIDATES ({len(sorted_rejected)})")
+            out("─" * 80)
 
             for evaluation in sorted_rejected:
-                rec_color = self._get_recommendation_color(evaluation.recommendation)
+                rec_color = colors[evaluation.recommendation]
 
-                # Get rejection info
-                rejection_info = self._get_rejection_info(
-                    job_name, evaluation.candidate_name
-                )
-                reason = (
-                    rejection_info.get("reason", "No reason provided")
-                    if rejection_info
-                    else "No reason provided"
+                reason = rejected_map[evaluation.candidate_name].get(
+                    "rejection_reason", "No reason provided"
                 )
 
-                print(
-                    f"\n    [{evaluation.overall_score}] {rec_color}{evaluation.recommendation.value}\033[0m {evaluation.candidate_name}"
+                out(
+                    f"\n    [{evaluation.overall_score}] {rec_color}{evaluation.recommendation.value}{reset} {evaluation.candidate_name}"
                 )
-                print(f"         Reason: {reason}")
+                out(f"         Reason: {reason}")
+
+            out("\n" + "=" * 80)
 
-            print("\n" + "=" * 80)
+        return lines
 
     def generate_html_report(
         self, job_context: JobContext, evaluations: List[Evaluation], output_path: str
@@ -262,16 +533,18 @@ class OutputGenerator:
         html_path = Path(output_path) / html_filename
 
         # Sort evaluations by score (descending)
-        sorted_evaluations = sorted(
-            evaluations, key=lambda e: e.overall_score, reverse=True
-        )
-
-        # Generate HTML content
-        html_content = self._build_html_content(job_context, sorted_evaluations)
-
-        # Write HTML file
-        with open(html_path, "w", encoding="utf-8") as htmlfile:
-            htmlfile.write(html_content)
+        sorted_evaluations = _sort_by_score(evaluations)
+
+        # Stream parts through a large buffer instead of holding the whole
+        # report in memory
+        with open(
+            html_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as htmlfile:
+            htmlfile.writelines(self._iter_html_parts(job_context, sorted_evaluations))
 
         return str(html_path)
 
@@ -285,14 +558,18 @@ class OutputGenerator:
         Returns:
             Path to saved JSON file
         """
-        # Create candidate directory
-        Path(candidate_dir).mkdir(parents=True, exist_ok=True)
-
         json_path = Path(candidate_dir) / "evaluation.json"
+        data = json_dumps_bytes(evaluation.to_dict(native_datetimes=True))
 
-        # Save evaluation
-        with open(json_path, "w", encoding="utf-8") as jsonfile:
-            json.dump(evaluation.to_dict(), jsonfile, indent=2, ensure_ascii=False)
+        # The candidate directory usually exists already; only create it when
+        # the open fails rather than paying a mkdir/stat on every save
+        try:
+            jsonfile = open(json_path, "wb", buffering=WRITE_BUFFER_SIZE)
+        except FileNotFoundError:
+            Path(candidate_dir).mkdir(parents=True, exist_ok=True)
+            jsonfile = open(json_path, "wb", buffering=WRITE_BUFFER_SIZE)
+        with jsonfile:
+            jsonfile.write(data)
 
         return str(json_path)
 
@@ -309,28 +586,23 @@ class OutputGenerator:
             List of evaluations (deduplicated by candidate name, keeping most recent)
         """
         evaluations = []
-        candidates_path = Path(self.config.candidates_path) / job_name
+        records = list(self._scan_job_dir(job_name))
 
-        if not candidates_path.exists():
-            return evaluations
+        # Reports usually follow a load; refresh their context from the same walk
+        self._report_context_cache[job_name] = self._build_report_context(records)
 
         # Load evaluations from each candidate directory
-        for candidate_dir in candidates_path.iterdir():
-            if candidate_dir.is_dir():
-                eval_path = candidate_dir / "evaluation.json"
-                if eval_path.exists():
-                    try:
-                        with open(eval_path, "r", encoding="utf-8") as jsonfile:
-                            eval_data = json.load(jsonfile)
-                            evaluation = Evaluation.from_dict(eval_data)
-                            evaluations.append(evaluation)
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        print(
-                            f"Warning: Could not load evaluation for {candidate_dir.name}: {e}"
-                        )
+        for record in records:
+            if record.evaluation is None:
+                continue
+            try:
+                evaluations.append(Evaluation.from_dict(record.evaluation))
+            except (KeyError, ValueError) as e:
+                print(f"Warning: Could not load evaluation for {record.name}: {e}")
 
-        # Deduplicate by candidate name, keeping the most recent evaluation
-        return self._deduplicate_evaluations(evaluations, silent=silent)
+        # Deduplicate by candidate name, keeping the most recent evaluation;
+        # returning them in score order makes the report sorts near free
+        return _sort_by_score(self._deduplicate_evaluations(evaluations, silent=silent))
 
     def _deduplicate_evaluations(
         self, evaluations: List[Evaluation], silent: bool = False
@@ -347,19 +619,25 @@ class OutputGenerator:
         if not evaluations:
             return evaluations
 
-        # Use more sophisticated matching instead of simple key-based grouping
-        unique_evaluations = []
+        # Same-candidate matching (see _are_same_candidate) is a subset test on
+        # name-part sets, so only entries sharing a name part can match. Index
+        # kept entries by part to avoid comparing against every one of them.
+        unique_evaluations: List[Evaluation] = []
+        unique_keys: List[FrozenSet[str]] = []
+        part_index: Dict[str, Set[int]] = {}
 
         for evaluation in evaluations:
-            # Check if this candidate already exists in our unique list
-            existing_index = None
-
-            for i, existing_eval in enumerate(unique_evaluations):
-                if self._are_same_candidate(
-                    evaluation.candidate_name, existing_eval.candidate_name
-                ):
-                    existing_index = i
-                    break
+            key = self._candidate_key(evaluation.candidate_name)
+
+            # Check if this candidate already exists in our unique list,
+            # taking the earliest kept entry that matches
+            sharing = set()
+            for part in key:
+                sharing.update(part_index.get(part, ()))
+            existing_index = min(
+                (i for i in sharing if key <= unique_keys[i] or unique_keys[i] <= key),
+                default=None,
+            )
 
             if existing_index is not None:
                 # Found a duplicate - keep the better one (prefer full names and more recent)
@@ -390,6 +668,11 @@ class OutputGenerator:
 
                 if should_replace:
                     unique_evaluations[existing_index] = evaluation
+                    for part in unique_keys[existing_index]:
+                        part_index[part].discard(existing_index)
+                    for part in key:
+                        part_index.setdefault(part, set()).add(existing_index)
+                    unique_keys[existing_index] = key
                     if not silent:
                         print(
                             f"📋 Deduplicated: Replaced {existing_eval.candidate_name} with {evaluation.candidate_name} ({reason})"
@@ -401,7 +684,10 @@ class OutputGenerator:
                         )
             else:
                 # No duplicate found, add to unique list
+                for part in key:
+                    part_index.setdefault(part, set()).add(len(unique_evaluations))
                 unique_evaluations.append(evaluation)
+                unique_keys.append(key)
 
         return unique_evaluations
 
@@ -414,37 +700,18 @@ class OutputGenerator:
         Returns:
             Normalized name for comparison
         """
-        # Convert to lowercase for comparison
-        normalized = name.lower()
-
-        # Remove common suffixes that indicate file types
-        type_suffixes = ["_resume", "_application", "_cover", "_coverletter"]
-        for suffix in type_suffixes:
-            if normalized.endswith(suffix):
-                normalized = normalized[: -len(suffix)]
-                break
-
-        # Split into parts for more sophisticated matching
-        parts = normalized.split("_")
-        parts = [part for part in parts if part]  # Remove empty parts
-
-        if not parts:
-            return normalized
-
-        # For single part names, check if it could be a last name
-        if len(parts) == 1:
-            single_part = parts[0]
-            # This will be used to match against multi-part names containing this part
-            return single_part
-
-        # For multi-part names, create multiple possible matches
-        # This handles firstname_lastname, lastname_firstname, etc.
-        if len(parts) >= 2:
-            # Primary key: sort all parts for consistent ordering
-            primary_key = "_".join(sorted(parts))
-            return primary_key
+        return _normalize_candidate_name(name)
 
-        return normalized
+    def _candidate_key(self, name: str) -> FrozenSet[str]:
+        """Get the set of normalized name parts used to match candidates.
+
+        Args:
+            name: Original candidate name
+
+        Returns:
+            Frozen set of name parts
+        """
+        return frozenset(self._normalize_candidate_name(name).split("_"))
 
     def _are_same_candidate(self, name1: str, name2: str) -> bool:
         """Check if two candidate names refer to the same person.
@@ -488,422 +755,490 @@ class OutputGenerator:
         if not evaluations:
             return {}
 
-        scores = [e.overall_score for e in evaluations]
-        recommendations = [e.recommendation.value for e in evaluations]
-        priorities = [e.interview_priority.value for e in evaluations]
-
-        # Count recommendations
-        rec_counts = {}
-        for rec in RecommendationType:
-            rec_counts[rec.value] = recommendations.count(rec.value)
-
-        # Count priorities
-        priority_counts = {}
-        for priority in InterviewPriority:
-            priority_counts[priority.value] = priorities.count(priority.value)
+        # Single pass over the evaluations; counts start at zero so every
+        # enum value appears in the result, in declaration order
+        rec_counts = {rec.value: 0 for rec in RecommendationType}
+        priority_counts = {priority.value: 0 for priority in InterviewPriority}
+        total_score = 0
+        highest_score = lowest_score = evaluations[0].overall_score
+        strong_candidates = high_priority_interviews = 0
+
+        for e in evaluations:
+            score = e.overall_score
+            total_score += score
+            if score > highest_score:
+                highest_score = score
+            elif score < lowest_score:
+                lowest_score = score
+            rec_counts[e.recommendation.value] += 1
+            priority_counts[e.interview_priority.value] += 1
+            if e.recommendation in STRONG_RECOMMENDATIONS:
+                strong_candidates += 1
+            if e.interview_priority is InterviewPriority.HIGH:
+                high_priority_interviews += 1
 
         return {
             "total_candidates": len(evaluations),
-            "average_score": sum(scores) / len(scores),
-            "highest_score": max(scores),
-            "lowest_score": min(scores),
+            "average_score": total_score / len(evaluations),
+            "highest_score": highest_score,
+            "lowest_score": lowest_score,
             "recommendation_counts": rec_counts,
             "priority_counts": priority_counts,
-            "strong_candidates": len(
-                [
-                    e
-                    for e in evaluations
-                    if e.recommendation
-                    in [RecommendationType.STRONG_YES, RecommendationType.YES]
-                ]
-            ),
-            "high_priority_interviews": len(
-                [
-                    e
-                    for e in evaluations
-                    if e.interview_priority == InterviewPriority.HIGH
-                ]
-            ),
+            "strong_candidates": strong_candidates,
+            "high_priority_interviews": high_priority_interviews,
         }
 
-    def _get_recommendation_color(self, recommendation: RecommendationType) -> str:
-        """Get ANSI color code for recommendation.
+    def _summary_stats_lines(self, evaluations: List[Evaluation]) -> List[str]:
+        """Build summary statistics lines for terminal output.
 
         Args:
-            recommendation: Recommendation type
-
-        Returns:
-            ANSI color code
-        """
-        colors = {
-            RecommendationType.STRONG_YES: "\033[92m",  # Green
-            RecommendationType.YES: "\033[94m",  # Blue
-            RecommendationType.MAYBE: "\033[93m",  # Yellow
-            RecommendationType.NO: "\033[91m",  # Red
-            RecommendationType.STRONG_NO: "\033[95m",  # Magenta
-        }
-        return colors.get(recommendation, "\033[0m")
-
-    def _get_priority_icon(self, priority: InterviewPriority) -> str:
-        """Get icon for interview priority.
-
-        Args:
-            priority: Interview priority
+            evaluations: List of evaluations
 
         Returns:
-            Priority icon
-        """
-        icons = {
-            InterviewPriority.HIGH: "🔥",
-            InterviewPriority.MEDIUM: "📋",
-            InterviewPriority.LOW: "📝",
-        }
-        return icons.get(priority, "📝")
-
-    def _display_summary_stats(self, evaluations: List[Evaluation]) -> None:
-        """Display summary statistics in terminal.
-
-        Args:
-            evaluations: List of evaluations
+            Output lines, empty when there are no evaluations
         """
         stats = self.generate_summary_stats(evaluations)
 
         if not stats:
-            return
-
-        print(f"📊 Summary Statistics:")
-        print(f"   Total Candidates: {stats['total_candidates']}")
-        print(f"   Average Score: {stats['average_score']:.1f}")
-        print(f"   Score Range: {stats['lowest_score']} - {stats['highest_score']}")
-        print(f"   Strong Candidates (YES/STRONG_YES): {stats['strong_candidates']}")
-        print(f"   High Priority Interviews: {stats['high_priority_interviews']}")
-
-    def _build_html_content(
+            return []
+
+        return [
+            "📊 Summary Statistics:",
+            f"   Total Candidates: {stats['total_candidates']}",
+            f"   Average Score: {stats['average_score']:.1f}",
+            f"   Score Range: {stats['lowest_score']} - {stats['highest_score']}",
+            f"   Strong Candidates (YES/STRONG_YES): {stats['strong_candidates']}",
+            f"   High Priority Interviews: {stats['high_priority_interviews']}",
+        ]
+
+    def _iter_html_parts(
         self, job_context: JobContext, evaluations: List[Evaluation]
-    ) -> str:
-        """Build HTML content for detailed report.
+    ) -> Iterator[str]:
+        """Yield the detailed HTML report in chunks, ready to stream to a file.
 
         Args:
             job_context: Job context information
-            evaluations: List of evaluations
+            evaluations: List of evaluations, sorted by score (descending)
 
-        Returns:
-            HTML content string
+        Yields:
+            Consecutive pieces of the HTML document
         """
         # Split into active and rejected for clearer presentation
-        active_evaluations: List[Evaluation] = []
-        rejected_evaluations: List[Evaluation] = []
-        for ev in evaluations:
-            if self._is_candidate_rejected(job_context.name, ev.candidate_name):
-                rejected_evaluations.append(ev)
-            else:
-                active_evaluations.append(ev)
+        active_evaluations, rejected_evaluations, rejected_map, duplicate_flags = (
+            self._partition_rejected(evaluations, job_context.name)
+        )
 
         # Stats only for active candidates
         stats = self.generate_summary_stats(active_evaluations)
 
-        # Load duplicate flags (by job name)
-        duplicate_flags = self._load_duplicate_warnings(job_context.name)
-
-        html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Candidate Evaluation Report - {job_context.name}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }}
-        .header {{ background-color: #f4f4f4; padding: 20px; border-radius: 5px; margin-bottom: 20px; }}
-        .stats {{ background-color: #e8f4fd; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .candidate {{ border: 1px solid #ddd; margin-bottom: 20px; padding: 15px; border-radius: 5px; }}
-        .candidate h3 {{ margin-top: 0; color: #333; }}
-        .score {{ font-size: 1.2em; font-weight: bold; }}
-        .recommendation {{ padding: 5px 10px; border-radius: 3px; color: white; }}
-        .strong-yes {{ background-color: #28a745; }}
-        .yes {{ background-color: #007bff; }}
-        .maybe {{ background-color: #ffc107; color: black; }}
-        .no {{ background-color: #dc3545; }}
-        .strong-no {{ background-color: #6f42c1; }}
-        .strengths {{ color: #28a745; }}
-        .concerns {{ color: #dc3545; }}
-        ul {{ margin: 5px 0; }}
-        .duplicate-banner {{ background-color: #ffe3e3; color: #b00020; padding: 8px 12px; border-radius: 4px; margin: 8px 0; font-weight: bold; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Candidate Evaluation Report</h1>
-        <h2>{job_context.name}</h2>
-        <p><strong>Generated:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-    </div>
-"""
+        yield HTML_HEAD.substitute(
+            job_name=escape(job_context.name),
+            generated=_format_timestamp(datetime.now()),
+        )
 
         # Add AI performance metrics (if available)
-        try:
-            job_dir = Path(self.config.get_job_path(job_context.name))
-            insights_path = job_dir / "insights.json"
-            if insights_path.exists():
-                with open(insights_path, "r", encoding="utf-8") as f:
-                    insights_data = json.load(f)
-                    metrics = insights_data.get("effectiveness_metrics", {})
-                    if metrics:
-                        html += """
+        metrics = self._load_insights_metrics(job_context.name)
+        if metrics:
+            yield """
     <div class="stats">
         <h3>AI Performance Metrics</h3>
 """
-                        html += f"        <p><strong>Agreement Rate:</strong> {metrics.get('agreement_rate', 0):.1%}</p>\n"
-                        if "explicit_agreements" in metrics:
-                            html += f"        <p><strong>Explicit Agreements:</strong> {metrics.get('explicit_agreements', 0)}</p>\n"
-                        if "explicit_disagreements" in metrics:
-                            html += f"        <p><strong>Disagreements (Learning from):</strong> {metrics.get('explicit_disagreements', 0)}</p>\n"
-                        if "no_feedback_count" in metrics:
-                            html += f"        <p><strong>Not Yet Reviewed/Implicit Agreement:</strong> {metrics.get('no_feedback_count', 0)}</p>\n"
-                        if "total_candidates" in metrics:
-                            html += f"        <p><strong>Total Candidates:</strong> {metrics.get('total_candidates', 0)}</p>\n"
-                        html += "    </div>\n"
-        except Exception:
-            pass
+            yield f"        <p><strong>Agreement Rate:</strong> {metrics.get('agreement_rate', 0):.1%}</p>\n"
+            if "explicit_agreements" in metrics:
+                yield f"        <p><strong>Explicit Agreements:</strong> {metrics.get('explicit_agreements', 0)}</p>\n"
+            if "explicit_disagreements" in metrics:
+                yield f"        <p><strong>Disagreements (Learning from):</strong> {metrics.get('explicit_disagreements', 0)}</p>\n"
+            if "no_feedback_count" in metrics:
+                yield f"        <p><strong>Not Yet Reviewed/Implicit Agreement:</strong> {metrics.get('no_feedback_count', 0)}</p>\n"
+            if "total_candidates" in metrics:
+                yield f"        <p><strong>Total Candidates:</strong> {metrics.get('total_candidates', 0)}</p>\n"
+            yield "    </div>\n"
 
         if stats:
-            html += f"""
-    <div class="stats">
-        <h3>Summary Statistics</h3>
-        <p><strong>Total Candidates:</strong> {stats['total_candidates']}</p>
-        <p><strong>Average Score:</strong> {stats['average_score']:.1f}</p>
-        <p><strong>Score Range:</strong> {stats['lowest_score']} - {stats['highest_score']}</p>
-        <p><strong>Strong Candidates:</strong> {stats['strong_candidates']}</p>
-        <p><strong>High Priority Interviews:</strong> {stats['high_priority_interviews']}</p>
-    </div>
-"""
+            yield HTML_SUMMARY_STATS.substitute(
+                stats, average_score=f"{stats['average_score']:.1f}"
+            )
 
-        html += "<h3>Candidate Evaluations</h3>"
+        yield "<h3>Candidate Evaluations</h3>"
 
         for rank, evaluation in enumerate(active_evaluations, 1):
-            rec_class = evaluation.recommendation.value.lower().replace("_", "-")
-
-            html += f"""
-    <div class="candidate">
-        <h3>{rank}. {evaluation.candidate_name}{' 🚨 DUPLICATE' if evaluation.candidate_name in duplicate_flags else ''}</h3>
-        <p>
-            <span class="score">Score: {evaluation.overall_score}/100</span> |
-            <span class="recommendation {rec_class}">{evaluation.recommendation.value}</span> |
-            <strong>Priority:</strong> {evaluation.interview_priority.value}
-        </p>
-"""
+            name = evaluation.candidate_name
+            yield HTML_CANDIDATE_HEADER.substitute(
+                rank=rank,
+                candidate_name=escape(name),
+                duplicate_tag=" 🚨 DUPLICATE" if name in duplicate_flags else "",
+                score=evaluation.overall_score,
+                rec_class=REC_HTML_CLASSES[evaluation.recommendation],
+                recommendation=evaluation.recommendation.value,
+                priority=evaluation.interview_priority.value,
+            )
 
             # Add duplicate banner if applicable
-            if evaluation.candidate_name in duplicate_flags:
-                banner = duplicate_flags[evaluation.candidate_name]
-                html += f"""
-        <div class="duplicate-banner">
-            🚨 Duplicate identifiers detected. {banner}
-        </div>
-"""
+            if name in duplicate_flags:
+                yield HTML_DUPLICATE_BANNER.substitute(
+                    banner=escape(duplicate_flags[name])
+                )
 
             if evaluation.strengths:
-                html += f"""
-        <div class="strengths">
-            <strong>Strengths:</strong>
-            <ul>
-                {''.join(f'<li>{strength}</li>' for strength in evaluation.strengths)}
-            </ul>
-        </div>
-"""
+                yield HTML_ITEM_LIST.substitute(
+                    css_class="strengths",
+                    title="Strengths",
+                    items="".join(
+                        f"<li>{escape(strength)}</li>"
+                        for strength in evaluation.strengths
+                    ),
+                )
 
             if evaluation.concerns:
-                html += f"""
-        <div class="concerns">
-            <strong>Concerns:</strong>
-            <ul>
-                {''.join(f'<li>{concern}</li>' for concern in evaluation.concerns)}
-            </ul>
-        </div>
-"""
+                yield HTML_ITEM_LIST.substitute(
+                    css_class="concerns",
+                    title="Concerns",
+                    items="".join(
+                        f"<li>{escape(concern)}</li>" for concern in evaluation.concerns
+                    ),
+                )
 
-            html += f"""
-        <p><strong>Detailed Notes:</strong> {evaluation.detailed_notes}</p>
-        <p><small><strong>Evaluated:</strong> {evaluation.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</small></p>
-    </div>
-"""
+            yield HTML_CANDIDATE_FOOTER.substitute(
+                detailed_notes=escape(evaluation.detailed_notes),
+                evaluated=_format_timestamp(evaluation.timestamp),
+            )
 
         # Rejected section
         if rejected_evaluations:
-            html += """
+            yield """
     <hr/>
     <h3>🚫 Rejected Candidates</h3>
     <p>The following candidates have been rejected and are excluded from evaluation rankings.</p>
 """
-            # Sort rejected by score descending for consistency
-            rejected_sorted = sorted(
-                rejected_evaluations, key=lambda e: e.overall_score, reverse=True
-            )
-            for evaluation in rejected_sorted:
-                info = self._get_rejection_info(
-                    job_context.name, evaluation.candidate_name
+            # Already in score order, like the active candidates
+            for evaluation in rejected_evaluations:
+                reason = rejected_map[evaluation.candidate_name].get(
+                    "rejection_reason", "No reason provided"
                 )
-                reason = (
-                    info.get("reason", "No reason provided")
-                    if info
-                    else "No reason provided"
+                yield HTML_REJECTED_CANDIDATE.substitute(
+                    candidate_name=escape(evaluation.candidate_name),
+                    score=evaluation.overall_score,
+                    rec_class=REC_HTML_CLASSES[evaluation.recommendation],
+                    recommendation=evaluation.recommendation.value,
+                    reason=escape(str(reason)),
+                    evaluated=_format_timestamp(evaluation.timestamp),
                 )
-                html += f"""
-    <div class="candidate">
-        <h3>{evaluation.candidate_name}</h3>
-        <p>
-            <span class=\"score\">Score: {evaluation.overall_score}/100</span> |
-            <span class=\"recommendation {evaluation.recommendation.value.lower().replace('_','-')}\">{evaluation.recommendation.value}</span>
-        </p>
-        <p><strong>Reason:</strong> {reason}</p>
-        <p><small><strong>Evaluated:</strong> {evaluation.timestamp.strftime("%Y-%m-%d %H:%M:%S")}</small></p>
-    </div>
-"""
 
-        html += """
+        yield """
 </body>
 </html>
 """
 
-        return html
-
-    def _is_candidate_rejected(self, job_name: str, candidate_name: str) -> bool:
-        """Check if a candidate is marked as rejected.
+    def _scan_job_dir(
+        self,
+        job_name: str,
+        load_evaluation: bool = True,
+        load_meta: bool = True,
+        load_duplicates: bool = True,
+    ) -> Iterator[JobCandidateRecord]:
+        """Read the per-candidate files of a job in a single directory walk.
 
         Args:
             job_name: Name of the job
-            candidate_name: Name of the candidate
+            load_evaluation: Read evaluation.json
+            load_meta: Read candidate_meta.json
+            load_duplicates: Read DUPLICATE_WARNING.txt
+
+        Yields:
+            One JobCandidateRecord per candidate directory; files that are
+            missing (or not requested) are left as None
+        """
+        candidates_path = os.path.join(self.config.candidates_path, job_name)
+        try:
+            entries = [entry for entry in os.scandir(candidates_path) if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        def read(entry: os.DirEntry) -> JobCandidateRecord:
+            return self._read_candidate_files(
+                entry, load_evaluation, load_meta, load_duplicates
+            )
+
+        # Reads are IO-bound, so threads hide per-file latency on large jobs;
+        # small jobs are not worth the pool startup cost
+        workers = self.config.load_workers
+        if workers > 1 and len(entries) >= PARALLEL_LOAD_MIN_CANDIDATES:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from executor.map(read, entries)
+        else:
+            yield from map(read, entries)
+
+    def _read_candidate_files(
+        self,
+        entry: os.DirEntry,
+        load_evaluation: bool,
+        load_meta: bool,
+        load_duplicates: bool,
+    ) -> JobCandidateRecord:
+        """Read the requested files of one candidate directory.
+
+        Args:
+            entry: Directory entry of the candidate
+            load_evaluation: Read evaluation.json
+            load_meta: Read candidate_meta.json
+            load_duplicates: Read DUPLICATE_WARNING.txt
 
         Returns:
-            True if candidate is rejected, False otherwise
+            JobCandidateRecord with missing (or not requested) files left as None
         """
-        # First check the exact candidate directory
-        candidate_dir = Path(self.config.get_candidate_path(job_name, candidate_name))
-        meta_path = candidate_dir / "candidate_meta.json"
+        evaluation = None
+        if load_evaluation:
+            try:
+                with open(
+                    os.path.join(entry.path, "evaluation.json"), "rb"
+                ) as jsonfile:
+                    evaluation = json_loads(jsonfile.read())
+            except FileNotFoundError:
+                pass
+            except ValueError as e:
+                # JSONDecodeError, or UnicodeDecodeError from the stdlib fallback
+                print(f"Warning: Could not load evaluation for {entry.name}: {e}")
 
-        if meta_path.exists():
+        meta = None
+        if load_meta:
             try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    if meta.get("rejected", False):
-                        return True
-            except (json.JSONDecodeError, KeyError):
+                with open(os.path.join(entry.path, "candidate_meta.json"), "rb") as f:
+                    meta = json_loads(f.read())
+            except (ValueError, OSError):
                 pass
 
-        # Also check other directories that might be the same candidate
-        # (due to deduplication/name variations)
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return False
+        duplicate_snippet = None
+        if load_duplicates:
+            try:
+                with open(
+                    os.path.join(entry.path, "DUPLICATE_WARNING.txt"),
+                    "r",
+                    encoding="utf-8",
+                ) as f:
+                    # Only the first few lines are summarized
+                    text = f.read(DUPLICATE_WARNING_READ_CHARS).strip()
+                # Try to extract one-line summary
+                lines = [l.strip() for l in text.splitlines() if l.strip()]
+                duplicate_snippet = (
+                    " ".join(lines[1:3])
+                    if len(lines) > 1
+                    else lines[0] if lines else ""
+                )
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError):
+                duplicate_snippet = ""
 
-        for other_dir in candidates_path.iterdir():
-            if not other_dir.is_dir():
-                continue
+        return JobCandidateRecord(entry.name, evaluation, meta, duplicate_snippet)
 
-            # Skip if it's the same directory we already checked
-            if other_dir == candidate_dir:
-                continue
+    def _partition_rejected(
+        self, evaluations: List[Evaluation], job_name: str
+    ) -> Tuple[List[Evaluation], List[Evaluation], Dict[str, dict], Dict[str, str]]:
+        """Split evaluations into active and rejected, keeping their order.
 
-            # Check if this directory represents the same candidate
-            if self._are_same_candidate(candidate_name, other_dir.name):
-                other_meta_path = other_dir / "candidate_meta.json"
-                if other_meta_path.exists():
-                    try:
-                        with open(other_meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                            if meta.get("rejected", False):
-                                return True
-                    except (json.JSONDecodeError, KeyError):
-                        pass
+        Args:
+            evaluations: Evaluations, usually sorted by score
+            job_name: Name of the job
 
-        return False
+        Returns:
+            Tuple of (active evaluations, rejected evaluations, rejected
+            candidate metadata from _resolve_rejections, duplicate warning map)
+        """
+        rejected_meta, duplicate_flags = self._load_report_context(job_name)
+        rejected_map = self._resolve_rejections(evaluations, rejected_meta)
+        active: List[Evaluation] = []
+        rejected: List[Evaluation] = []
+        for evaluation in evaluations:
+            if evaluation.candidate_name in rejected_map:
+                rejected.append(evaluation)
+            else:
+                active.append(evaluation)
+        return active, rejected, rejected_map, duplicate_flags
 
-    def _get_rejection_info(self, job_name: str, candidate_name: str) -> Optional[dict]:
-        """Get rejection information for a candidate.
+    def _load_report_context(
+        self, job_name: str
+    ) -> Tuple[Dict[str, dict], Dict[str, str]]:
+        """Load rejection metadata and duplicate flags in one directory walk.
+
+        The result is cached per job until load_evaluations_for_job refreshes
+        it or invalidate_job_cache is called.
 
         Args:
             job_name: Name of the job
-            candidate_name: Name of the candidate
 
         Returns:
-            Dict with rejection info or None if not rejected
+            Tuple of (metadata of rejected candidates only, duplicate warning map)
         """
-        # First check the exact candidate directory
-        candidate_dir = Path(self.config.get_candidate_path(job_name, candidate_name))
-        meta_path = candidate_dir / "candidate_meta.json"
+        context = self._report_context_cache.get(job_name)
+        if context is None:
+            context = self._build_report_context(
+                self._scan_job_dir(job_name, load_evaluation=False)
+            )
+            self._report_context_cache[job_name] = context
+        return context
 
-        if meta_path.exists():
-            try:
-                with open(meta_path, "r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    if meta.get("rejected", False):
-                        return {
-                            "reason": meta.get(
-                                "rejection_reason", "No reason provided"
-                            ),
-                            "timestamp": meta.get("rejection_timestamp", "Unknown"),
-                        }
-            except (json.JSONDecodeError, KeyError):
-                pass
+    def _build_report_context(
+        self, records: Iterable[JobCandidateRecord]
+    ) -> Tuple[Dict[str, dict], Dict[str, str]]:
+        """Collect rejection metadata and duplicate flags from scanned records.
 
-        # Also check other directories that might be the same candidate
-        # (due to deduplication/name variations)
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return None
+        Args:
+            records: Records from _scan_job_dir with meta and duplicates loaded
 
-        for other_dir in candidates_path.iterdir():
-            if not other_dir.is_dir():
-                continue
+        Returns:
+            Tuple of (metadata of rejected candidates only, duplicate warning map)
+        """
+        rejected_meta: Dict[str, dict] = {}
+        duplicate_flags: Dict[str, str] = {}
+        for record in records:
+            if record.meta is not None and record.meta.get("rejected", False):
+                rejected_meta[record.name] = record.meta
+            if record.duplicate_snippet is not None:
+                duplicate_flags[record.name] = record.duplicate_snippet
+        return rejected_meta, duplicate_flags
+
+    def _resolve_rejections(
+        self, evaluations: List[Evaluation], rejected_meta: Dict[str, dict]
+    ) -> Dict[str, dict]:
+        """Resolve the rejection metadata of each evaluated candidate once.
 
-            # Skip if it's the same directory we already checked
-            if other_dir == candidate_dir:
-                continue
+        Args:
+            evaluations: Evaluations to check
+            rejected_meta: Metadata of rejected candidates, keyed by directory
+
+        Returns:
+            Mapping of rejected candidate_name -> candidate metadata
+        """
+        rejected_map: Dict[str, dict] = {}
+        if not rejected_meta:
+            return rejected_map
+        for evaluation in evaluations:
+            meta = self._find_rejection_meta(evaluation.candidate_name, rejected_meta)
+            if meta is not None:
+                rejected_map[evaluation.candidate_name] = meta
+        return rejected_map
+
+    def _load_job_meta(self, job_name: str) -> Dict[str, dict]:
+        """Load candidate metadata for every candidate in a job.
+
+        Callers that check many candidates should load this once and pass it to
+        _is_candidate_rejected / _get_rejection_info instead of re-reading
+        candidate_meta.json per candidate.
 
-            # Check if this directory represents the same candidate
-            if self._are_same_candidate(candidate_name, other_dir.name):
-                other_meta_path = other_dir / "candidate_meta.json"
-                if other_meta_path.exists():
-                    try:
-                        with open(other_meta_path, "r", encoding="utf-8") as f:
-                            meta = json.load(f)
-                            if meta.get("rejected", False):
-                                return {
-                                    "reason": meta.get(
-                                        "rejection_reason", "No reason provided"
-                                    ),
-                                    "timestamp": meta.get(
-                                        "rejection_timestamp", "Unknown"
-                                    ),
-                                }
-                    except (json.JSONDecodeError, KeyError):
-                        pass
+        Args:
+            job_name: Name of the job
+
+        Returns:
+            Mapping of candidate directory name -> parsed candidate_meta.json
+        """
+        return {
+            record.name: record.meta
+            for record in self._scan_job_dir(
+                job_name, load_evaluation=False, load_duplicates=False
+            )
+            if record.meta is not None
+        }
+
+    def _find_rejection_meta(
+        self, candidate_name: str, job_meta: Dict[str, dict]
+    ) -> Optional[dict]:
+        """Find the metadata marking a candidate as rejected.
+
+        Checks the candidate's own directory first, then directories that
+        represent the same candidate (due to deduplication/name variations).
+
+        Args:
+            candidate_name: Name of the candidate
+            job_meta: Candidate metadata from _load_job_meta
+
+        Returns:
+            Rejected candidate metadata, or None if not rejected
+        """
+        meta = job_meta.get(candidate_name)
+        if meta and meta.get("rejected", False):
+            return meta
+
+        for other_name, other_meta in job_meta.items():
+            if other_name == candidate_name or not other_meta.get("rejected", False):
+                continue
+            if self._are_same_candidate(candidate_name, other_name):
+                return other_meta
 
         return None
 
+    def _is_candidate_rejected(
+        self,
+        job_name: str,
+        candidate_name: str,
+        job_meta: Optional[Dict[str, dict]] = None,
+    ) -> bool:
+        """Check if a candidate is marked as rejected.
+
+        Args:
+            job_name: Name of the job
+            candidate_name: Name of the candidate
+            job_meta: Pre-loaded metadata from _load_job_meta (loaded if None)
+
+        Returns:
+            True if candidate is rejected, False otherwise
+        """
+        if job_meta is None:
+            job_meta = self._load_job_meta(job_name)
+        return self._find_rejection_meta(candidate_name, job_meta) is not None
+
+    def _get_rejection_info(
+        self,
+        job_name: str,
+        candidate_name: str,
+        job_meta: Optional[Dict[str, dict]] = None,
+    ) -> Optional[dict]:
+        """Get rejection information for a candidate.
+
+        Args:
+            job_name: Name of the job
+            candidate_name: Name of the candidate
+            job_meta: Pre-loaded metadata from _load_job_meta (loaded if None)
+
+        Returns:
+            Dict with rejection info or None if not rejected
+        """
+        if job_meta is None:
+            job_meta = self._load_job_meta(job_name)
+        meta = self._find_rejection_meta(candidate_name, job_meta)
+        if meta is None:
+            return None
+        return {
+            "reason": meta.get("rejection_reason", "No reason provided"),
+            "timestamp": meta.get("rejection_timestamp", "Unknown"),
+        }
+
     def _load_duplicate_warnings(self, job_name: str) -> Dict[str, str]:
         """Load duplicate warning snippets for all candidates in a job.
 
         Returns a mapping: candidate_name -> short snippet from warning file.
         """
-        flags: Dict[str, str] = {}
-        candidates_path = Path(self.config.candidates_path) / job_name
-        if not candidates_path.exists():
-            return flags
-        for candidate_dir in candidates_path.iterdir():
-            if not candidate_dir.is_dir():
-                continue
-            warning_path = candidate_dir / "DUPLICATE_WARNING.txt"
-            if warning_path.exists():
-                try:
-                    text = warning_path.read_text(encoding="utf-8").strip()
-                    # Try to extract one-line summary
-                    lines = [l.strip() for l in text.splitlines() if l.strip()]
-                    summary = (
-                        " ".join(lines[1:3])
-                        if len(lines) > 1
-                        else lines[0] if lines else ""
-                    )
-                    flags[candidate_dir.name] = summary
-                except OSError:
-                    flags[candidate_dir.name] = ""
-        return flags
+        return {
+            record.name: record.duplicate_snippet
+            for record in self._scan_job_dir(
+                job_name, load_evaluation=False, load_meta=False
+            )
+            if record.duplicate_snippet is not None
+        }
+
+    def _load_insights_metrics(self, job_name: str) -> Dict:
+        """Load AI effectiveness metrics from a job's insights file.
+
+        Args:
+            job_name: Name of the job
+
+        Returns:
+            Effectiveness metrics dict, empty if the file is missing or unreadable
+        """
+        insights_path = os.path.join(
+            self.config.get_job_path(job_name), "insights.json"
+        )
+        try:
+            with open(insights_path, "rb") as f:
+                return json_loads(f.read()).get("effectiveness_metrics", {}) or {}
+        except Exception:
+            return {}
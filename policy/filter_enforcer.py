@@ -5,10 +5,38 @@ that penalties and recommendation rules are enforced consistently regardless of
 LLM variability.
 """
 
+import re
 from typing import Dict, List, Optional
 
 from models import Evaluation, RecommendationType
 
+_FAILED_FILTERS_MARKER = "Failed filters:"
+
+# A line starting (after optional indentation) with the marker
+_FAILED_FILTERS_LINE_RE = re.compile(
+    r"^[^\S\n]*" + re.escape(_FAILED_FILTERS_MARKER) + r"(.*)$", re.MULTILINE
+)
+
+# Recommendation values from least to most favourable
+_REC_RANK = {
+    rec.value: rank
+    for rank, rec in enumerate(
+        (
+            RecommendationType.STRONG_NO,
+            RecommendationType.NO,
+            RecommendationType.MAYBE,
+            RecommendationType.YES,
+            RecommendationType.STRONG_YES,
+        )
+    )
+}
+
+
+def _split_filter_ids(ids_part: str) -> List[str]:
+    """Split the comma-separated IDs that follow the 'Failed filters:' marker."""
+    ids_part = ids_part.strip().strip(". ")
+    return [p.strip() for p in ids_part.split(",") if p.strip()]
+
 
 def _parse_applied_filters_from_notes(detailed_notes: str) -> List[str]:
     """Extract applied filter IDs from the 'Failed filters:' prefix in notes.
@@ -16,36 +44,66 @@ def _parse_applied_filters_from_notes(detailed_notes: str) -> List[str]:
     Expected pattern at the start of the notes (first line):
         "Failed filters: id1, id2"
     """
-    if not detailed_notes:
+    # Most evaluations fail no filters: one substring check, no regex scan
+    if not detailed_notes or _FAILED_FILTERS_MARKER not in detailed_notes:
         return []
-    marker = "Failed filters:"
-    first_line = detailed_notes.split("\n", 1)[0]
-    if marker in first_line:
-        ids_part = first_line.split(marker, 1)[-1].strip().strip(". ")
-        parsed = [p.strip() for p in ids_part.split(",") if p.strip()]
+
+    # Slice out the first line without splitting the rest of the notes
+    end = detailed_notes.find("\n")
+    first_line = detailed_notes if end == -1 else detailed_notes[:end]
+    if _FAILED_FILTERS_MARKER in first_line:
+        parsed = _split_filter_ids(first_line.split(_FAILED_FILTERS_MARKER, 1)[-1])
         if parsed:
             return parsed
 
     # Fallback: look for a line starting with the marker anywhere
-    for line in detailed_notes.splitlines():
-        if line.strip().startswith(marker):
-            ids_part = line.split(marker, 1)[-1].strip().strip(". ")
-            parsed = [p.strip() for p in ids_part.split(",") if p.strip()]
-            if parsed:
-                return parsed
+    for match in _FAILED_FILTERS_LINE_RE.finditer(detailed_notes):
+        parsed = _split_filter_ids(match.group(1))
+        if parsed:
+            return parsed
     return []
 
 
+def compile_filter_actions(screening_filters: Optional[Dict]) -> Dict[str, Dict]:
+    """Map the IDs of enabled filters to their actions.
+
+    Callers enforcing filters on many evaluations should build this once
+    per job and pass it to enforce_filters_on_evaluation.
+
+    Args:
+        screening_filters: Parsed screening_filters.json document
+
+    Returns:
+        Mapping of filter ID -> action dict; empty (never raising) when the
+        document is malformed
+    """
+    if not screening_filters or not isinstance(screening_filters, dict):
+        return {}
+    items = screening_filters.get("filters") or []
+    if not isinstance(items, list):
+        return {}
+    actions = {}
+    for f in items:
+        if not isinstance(f, dict) or not f.get("enabled", True):
+            continue
+        actions[str(f.get("id"))] = f.get("action", {})
+    return actions
+
+
 def enforce_filters_on_evaluation(
     evaluation: Evaluation,
     screening_filters: Optional[Dict],
     verbose: bool = False,
+    filter_actions: Optional[Dict[str, Dict]] = None,
 ) -> Evaluation:
     """Apply deterministic enforcement rules to an Evaluation in-place.
 
     - Deduct points as specified by filters
     - Force or cap recommendation according to actions
 
+    filter_actions, when given, must come from compile_filter_actions on the
+    same screening_filters; otherwise it is built for this call.
+
     Returns the same Evaluation instance for convenience.
     """
     if not screening_filters or not isinstance(screening_filters, dict):
@@ -55,16 +113,16 @@ def enforce_filters_on_evaluation(
     if not items:
         return evaluation
 
-    id_to_action: Dict[str, Dict] = {
-        str(f.get("id")): (f.get("action", {}) if isinstance(f, dict) else {})
-        for f in items
-        if f and f.get("enabled", True)
-    }
-
     applied_filters = _parse_applied_filters_from_notes(evaluation.detailed_notes)
     if not applied_filters:
         return evaluation
 
+    id_to_action = (
+        filter_actions
+        if filter_actions is not None
+        else compile_filter_actions(screening_filters)
+    )
+
     forced_recommendation = None
     cap_recommendation = None
     total_deduction = 0
@@ -109,24 +167,16 @@ def enforce_filters_on_evaluation(
             )
 
     # Apply recommendation overrides/caps
-    rec_order = [
-        RecommendationType.STRONG_NO.value,
-        RecommendationType.NO.value,
-        RecommendationType.MAYBE.value,
-        RecommendationType.YES.value,
-        RecommendationType.STRONG_YES.value,
-    ]
-
     try:
         current_rec = evaluation.recommendation.value
-        if forced_recommendation and forced_recommendation in rec_order:
+        if forced_recommendation and forced_recommendation in _REC_RANK:
             evaluation.recommendation = RecommendationType(forced_recommendation)
         elif (
             cap_recommendation
-            and current_rec in rec_order
-            and cap_recommendation in rec_order
+            and current_rec in _REC_RANK
+            and cap_recommendation in _REC_RANK
         ):
-            if rec_order.index(current_rec) > rec_order.index(cap_recommendation):
+            if _REC_RANK[current_rec] > _REC_RANK[cap_recommendation]:
                 evaluation.recommendation = RecommendationType(cap_recommendation)
     except (ValueError, AttributeError) as e:
         print(
@@ -0,0 +1,10 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# Keep tmp_path directories in RAM on Linux so the many small files the tests
+# write never hit the disk. An explicit PYTEST_DEBUG_TEMPROOT or --basetemp
+# still wins.
+if sys.platform.startswith("linux") and os.access("/dev/shm", os.W_OK):
+    os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", "/dev/shm")
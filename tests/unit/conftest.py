@@ -0,0 +1,49 @@
+"""Shared fixtures for unit tests."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from config import Config
+
+# Test-harness settings that must survive the cleared environment; pytest
+# reads PYTEST_DEBUG_TEMPROOT lazily, on the first tmp_path request
+_PRESERVED_ENV_VARS = ("PYTEST_DEBUG_TEMPROOT",)
+
+
+def _clean_environ():
+    """Patch os.environ down to the preserved harness settings."""
+    preserved = {k: os.environ[k] for k in _PRESERVED_ENV_VARS if k in os.environ}
+    return patch.dict(os.environ, preserved, clear=True)
+
+
+@pytest.fixture(autouse=True)
+def _clean_env():
+    """Run every unit test against an empty environment.
+
+    patch.dict restores the full snapshot afterwards, including variables
+    set by the code under test (e.g. Config.load_env); tests that need a
+    setting use monkeypatch.setenv.
+    """
+    with _clean_environ():
+        yield
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Config built once per test module from an empty environment.
+
+    Config reads its settings from os.environ on every property access, so
+    tests asserting on setting values still need their own environment patch.
+    """
+    with _clean_environ():
+        return Config()
+
+
+@pytest.fixture(scope="session")
+def empty_pdf(tmp_path_factory):
+    """Path to a zero-byte .pdf file, created once per test session."""
+    path = tmp_path_factory.mktemp("pdf") / "empty.pdf"
+    path.touch()
+    return str(path)
@@ -15,6 +15,35 @@ from models import (
     RecommendationType,
 )
 
+# Well-formed evaluation payload; tests derive variants with {**VALID_EVALUATION, ...}
+VALID_EVALUATION = {
+    "overall_score": 85,
+    "recommendation": "YES",
+    "strengths": ["Strong skills", "Good experience"],
+    "concerns": ["Minor issue"],
+    "interview_priority": "HIGH",
+    "detailed_notes": "Good candidate",
+    "insights_applied": "Applied insights",
+}
+VALID_EVALUATION_JSON = json.dumps(VALID_EVALUATION)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_openai_sdk():
+    """Replace the OpenAI SDK client; building a real one costs ~40 ms each.
+
+    Tests only exercise AIClient's own request building and parsing, and
+    patch the completions call where they need a response.
+    """
+    with patch("ai_client.OpenAI") as mock_openai:
+        yield mock_openai
+
+
+@pytest.fixture(scope="module")
+def ai_client():
+    """Shared client for tests that only call pure prompt/parsing helpers."""
+    return AIClient("test_key", "gpt-4o")
+
 
 class TestAIClient:
     """Test AI client functionality."""
@@ -43,9 +72,7 @@ class TestAIClient:
         # Mock the OpenAI client
         mock_response = Mock()
         mock_response.choices = [Mock()]
-        mock_response.choices[0].message.content = (
-            '{"overall_score": 75, "recommendation": "YES", "strengths": ["test"], "concerns": ["test"], "interview_priority": "MEDIUM", "detailed_notes": "test"}'
-        )
+        mock_response.choices[0].message.content = VALID_EVALUATION_JSON
         mock_response.usage = None
 
         with patch.object(
@@ -69,10 +96,8 @@ class TestAIClient:
             )
             assert opposite not in call_kwargs
 
-    def test_evaluation_prompt_building(self):
+    def test_evaluation_prompt_building(self, ai_client):
         """Test evaluation prompt construction."""
-        client = AIClient("test_key", "gpt-4o")
-
         job_context = JobContext(
             name="test_job",
             description="Test job description",
@@ -89,7 +114,7 @@ class TestAIClient:
 
         insights = "Test insights"
 
-        prompt = client._build_evaluation_prompt(job_context, candidate, insights)
+        prompt = ai_client._build_evaluation_prompt(job_context, candidate, insights)
 
         assert "Test job description" in prompt
         assert "Test ideal candidate" in prompt
@@ -119,17 +144,7 @@ class TestAIClient:
             captured["messages"] = messages
             return APIResponse(
                 success=True,
-                content=json.dumps(
-                    {
-                        "overall_score": 75,
-                        "recommendation": "YES",
-                        "strengths": ["x"],
-                        "concerns": ["y"],
-                        "interview_priority": "MEDIUM",
-                        "detailed_notes": "ok",
-                        "insights_applied": None,
-                    }
-                ),
+                content=VALID_EVALUATION_JSON,
             )
 
         with patch.object(client, "_make_request", side_effect=fake_make_request):
@@ -139,24 +154,10 @@ class TestAIClient:
         assert "WARNING FLAGS:" in user_content
         assert "No remote work" in user_content
 
-    def test_evaluation_response_parsing(self):
+    def test_evaluation_response_parsing(self, ai_client):
         """Test parsing of evaluation responses."""
-        client = AIClient("test_key", "gpt-4o")
-
         # Test valid JSON response
-        valid_response = json.dumps(
-            {
-                "overall_score": 85,
-                "recommendation": "YES",
-                "strengths": ["Strong skills", "Good experience"],
-                "concerns": ["Minor issue"],
-                "interview_priority": "HIGH",
-                "detailed_notes": "Good candidate",
-                "insights_applied": "Applied insights",
-            }
-        )
-
-        parsed = client._parse_evaluation_response(valid_response)
+        parsed = ai_client._parse_evaluation_response(VALID_EVALUATION_JSON)
 
         assert parsed["overall_score"] == 85
         assert parsed["recommendation"] == "YES"
@@ -164,36 +165,30 @@ class TestAIClient:
         assert len(parsed["concerns"]) == 1
         assert parsed["interview_priority"] == "HIGH"
 
-    def test_evaluation_response_parsing_invalid_json(self):
+    def test_evaluation_response_parsing_invalid_json(self, ai_client):
         """Test parsing of invalid JSON responses."""
-        client = AIClient("test_key", "gpt-4o")
-
         # Test invalid JSON
         invalid_response = "This is not JSON"
 
-        parsed = client._parse_evaluation_response(invalid_response)
+        parsed = ai_client._parse_evaluation_response(invalid_response)
 
         assert parsed["overall_score"] == 0
         assert parsed["recommendation"] == "NO"
         assert "Failed to parse" in parsed["concerns"][0]
 
-    def test_evaluation_response_validation(self):
+    def test_evaluation_response_validation(self, ai_client):
         """Test validation of evaluation response values."""
-        client = AIClient("test_key", "gpt-4o")
-
         # Test with invalid enum values
         invalid_response = json.dumps(
             {
+                **VALID_EVALUATION,
                 "overall_score": 150,  # Too high
                 "recommendation": "INVALID_REC",  # Invalid enum
-                "strengths": ["test"],
-                "concerns": ["test"],
                 "interview_priority": "INVALID_PRIORITY",  # Invalid enum
-                "detailed_notes": "test",
             }
         )
 
-        parsed = client._parse_evaluation_response(invalid_response)
+        parsed = ai_client._parse_evaluation_response(invalid_response)
 
         assert parsed["overall_score"] == 100  # Clamped to max
         assert parsed["recommendation"] == "NO"  # Default for invalid
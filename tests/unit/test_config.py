@@ -1,9 +1,7 @@
 """Unit tests for configuration management."""
 
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -13,9 +11,9 @@ from config import Config, ValidationResult
 class TestConfig:
     """Test configuration management."""
 
-    def test_default_paths(self):
+    def test_default_paths(self, default_config):
         """Test default path configuration."""
-        config = Config()
+        config = default_config
 
         # Get base path from environment or use default
         expected_base = os.getenv("BASE_DATA_PATH", "./data")
@@ -28,86 +26,87 @@ class TestConfig:
         assert config.max_file_size_mb == 2
         assert config.max_file_size_bytes == 2 * 1024 * 1024
 
-    def test_env_file_loading(self):
+    def test_env_file_loading(self, tmp_path):
         """Test loading configuration from .env file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("OPENAI_API_KEY=test_key_123\n")
-            f.write("MAX_FILE_SIZE_MB=5\n")
-            f.write("BASE_DATA_PATH=/tmp/test_data\n")
-            env_file = f.name
-
-        try:
-            # Clear environment variables to ensure clean test
-            with patch.dict(os.environ, {}, clear=True):
-                config = Config(env_file=env_file)
-
-                assert config.openai_api_key == "test_key_123"
-                assert config.max_file_size_mb == 5
-                assert config.base_data_path == "/tmp/test_data"
-        finally:
-            os.unlink(env_file)
-
-    def test_validation_missing_api_key(self):
+        env_file = tmp_path / "test.env"
+        env_file.write_text(
+            "OPENAI_API_KEY=test_key_123\n"
+            "MAX_FILE_SIZE_MB=5\n"
+            "BASE_DATA_PATH=/tmp/test_data\n"
+        )
+
+        config = Config(env_file=str(env_file))
+
+        assert config.openai_api_key == "test_key_123"
+        assert config.max_file_size_mb == 5
+        assert config.base_data_path == "/tmp/test_data"
+
+    def test_env_file_reloaded_after_edit(self, tmp_path, monkeypatch):
+        """Test that cached .env parsing follows file edits and keeps env vars."""
+        env_file = tmp_path / "test.env"
+        env_file.write_text("MAX_FILE_SIZE_MB=5\n")
+
+        Config(env_file=str(env_file))
+        assert os.environ["MAX_FILE_SIZE_MB"] == "5"
+
+        env_file.write_text("MAX_FILE_SIZE_MB=7\n")
+        monkeypatch.delenv("MAX_FILE_SIZE_MB")
+        assert Config(env_file=str(env_file)).max_file_size_mb == 7
+
+        monkeypatch.setenv("MAX_FILE_SIZE_MB", "3")
+        assert Config(env_file=str(env_file)).max_file_size_mb == 3
+
+    def test_env_file_interpolation_uses_existing_environment(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that ${VAR} expands like load_dotenv, preferring the environment."""
+        env_file = tmp_path / "test.env"
+        env_file.write_text("A=file-x\nB=${A}\n")
+        monkeypatch.setenv("A", "env-x")
+
+        Config(env_file=str(env_file))
+
+        assert os.environ["A"] == "env-x"
+        assert os.environ["B"] == "env-x"
+
+    def test_validation_missing_api_key(self, tmp_path):
         """Test validation with missing API key."""
         # Create config without API key
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("# No API key\n")
-            env_file = f.name
-
-        try:
-            # Clear environment variables to ensure clean test
-            with patch.dict(os.environ, {}, clear=True):
-                config = Config(env_file=env_file)
-                result = config.validate_required_settings()
-
-                assert not result.is_valid
-                assert any(
-                    "OPENAI_API_KEY is required" in error for error in result.errors
-                )
-        finally:
-            os.unlink(env_file)
-
-    def test_validation_invalid_file_size(self):
+        env_file = tmp_path / "test.env"
+        env_file.write_text("# No API key\n")
+
+        config = Config(env_file=str(env_file))
+        result = config.validate_required_settings()
+
+        assert not result.is_valid
+        assert any("OPENAI_API_KEY is required" in error for error in result.errors)
+
+    def test_validation_invalid_file_size(self, tmp_path):
         """Test validation with invalid file size."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-            f.write("OPENAI_API_KEY=sk-test123\n")
-            f.write("MAX_FILE_SIZE_MB=0\n")
-            env_file = f.name
-
-        try:
-            # Clear environment variables to ensure clean test
-            with patch.dict(os.environ, {}, clear=True):
-                config = Config(env_file=env_file)
-                result = config.validate_required_settings()
-
-                assert not result.is_valid
-                assert any(
-                    "MAX_FILE_SIZE_MB must be greater than 0" in error
-                    for error in result.errors
-                )
-        finally:
-            os.unlink(env_file)
-
-    def test_get_job_path(self):
-        """Test job path generation."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            path = config.get_job_path("test_job")
-
-            assert path == "./data/jobs/test_job"
-
-    def test_get_candidate_path(self):
-        """Test candidate path generation."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            path = config.get_candidate_path("test_job", "john_doe")
-
-            assert path == "./data/candidates/test_job/john_doe"
-
-    def test_get_output_path(self):
-        """Test output path generation."""
-        with patch.dict(os.environ, {}, clear=True):
-            config = Config()
-            path = config.get_output_path("test_job")
-
-            assert path == "./data/output/test_job"
+        env_file = tmp_path / "test.env"
+        env_file.write_text("OPENAI_API_KEY=sk-test123\nMAX_FILE_SIZE_MB=0\n")
+
+        config = Config(env_file=str(env_file))
+        result = config.validate_required_settings()
+
+        assert not result.is_valid
+        assert any(
+            "MAX_FILE_SIZE_MB must be greater than 0" in error
+            for error in result.errors
+        )
+
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("get_job_path", ("test_job",), "./data/jobs/test_job"),
+            (
+                "get_candidate_path",
+                ("test_job", "john_doe"),
+                "./data/candidates/test_job/john_doe",
+            ),
+            ("get_output_path", ("test_job",), "./data/output/test_job"),
+        ],
+    )
+    def test_path_helpers(self, default_config, method, args, expected):
+        """Test job, candidate and output path generation."""
+        assert getattr(default_config, method)(*args) == expected
@@ -0,0 +1,102 @@
+"""Unit tests for screening filter enforcement."""
+
+import pytest
+
+from models import Evaluation, InterviewPriority, RecommendationType
+from policy.filter_enforcer import (
+    _parse_applied_filters_from_notes,
+    compile_filter_actions,
+    enforce_filters_on_evaluation,
+)
+
+
+class TestParseAppliedFilters:
+    """Test parsing of the 'Failed filters:' marker in detailed notes."""
+
+    @pytest.mark.parametrize(
+        "notes, expected",
+        [
+            ("", []),
+            ("Strong candidate overall.", []),
+            ("Failed filters: no-visa, junior.\nDetails follow", ["no-visa", "junior"]),
+            ("**Failed filters: no-visa**", ["no-visa**"]),
+            ("Summary first\n  Failed filters: remote-only\nMore", ["remote-only"]),
+            ("Failed filters:\nFailed filters: late-start", ["late-start"]),
+            ("Summary\nSee Failed filters: ignored", []),
+        ],
+    )
+    def test_parse(self, notes, expected):
+        """Test first-line and fallback line parsing."""
+        assert _parse_applied_filters_from_notes(notes) == expected
+
+
+class TestEnforceFilters:
+    """Test deterministic enforcement of filter actions."""
+
+    def test_deducts_points_and_caps_recommendation(self):
+        """Test that matched filters apply deductions and caps."""
+        evaluation = Evaluation(
+            candidate_name="john_doe",
+            job_name="test_job",
+            overall_score=80,
+            recommendation=RecommendationType.STRONG_YES,
+            strengths=[],
+            concerns=[],
+            interview_priority=InterviewPriority.HIGH,
+            detailed_notes="Failed filters: no-visa\nNeeds sponsorship",
+        )
+        screening_filters = {
+            "filters": [
+                {
+                    "id": "no-visa",
+                    "action": {"deduct_points": 30, "cap_recommendation": "MAYBE"},
+                }
+            ]
+        }
+
+        enforce_filters_on_evaluation(evaluation, screening_filters)
+
+        assert evaluation.overall_score == 50
+        assert evaluation.recommendation == RecommendationType.MAYBE
+
+    def test_precompiled_actions_match_per_call_lookup(self):
+        """Test that a shared action lookup gives the same result."""
+        screening_filters = {
+            "filters": [
+                {"id": "no-visa", "action": {"deduct_points": 10}},
+                {"id": "junior", "enabled": False, "action": {"deduct_points": 50}},
+            ]
+        }
+        filter_actions = compile_filter_actions(screening_filters)
+        assert list(filter_actions) == ["no-visa"]
+
+        for score in (90, 40):
+            evaluation = Evaluation(
+                candidate_name="john_doe",
+                job_name="test_job",
+                overall_score=score,
+                recommendation=RecommendationType.YES,
+                strengths=[],
+                concerns=[],
+                interview_priority=InterviewPriority.MEDIUM,
+                detailed_notes="Failed filters: no-visa, junior",
+            )
+            enforce_filters_on_evaluation(
+                evaluation, screening_filters, filter_actions=filter_actions
+            )
+            assert evaluation.overall_score == score - 10
+
+    @pytest.mark.parametrize(
+        "screening_filters, expected",
+        [
+            ({"filters": None}, {}),
+            ({"filters": "no-visa"}, {}),
+            (
+                {"filters": ["x", None, {"id": "no-visa", "action": {}}]},
+                {"no-visa": {}},
+            ),
+        ],
+    )
+    def test_compile_skips_malformed_filters(self, screening_filters, expected):
+        """Test that a malformed filters document never raises."""
+        assert compile_filter_actions(screening_filters) == expected
@@ -0,0 +1,70 @@
+"""Unit tests for JSON encoding helpers."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import json_utils
+from models import Evaluation, InterviewPriority, RecommendationType
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def encoder_backend(request, monkeypatch):
+    """Run a test against both the orjson and stdlib encoders."""
+    if request.param and json_utils.orjson is None:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_utils, "USE_ORJSON", request.param)
+    return request.param
+
+
+class TestJsonDumps:
+    """Test json_dumps helper."""
+
+    def test_native_datetimes_match_iso_strings(self, encoder_backend):
+        """Test that native datetimes serialize like pre-formatted ISO strings."""
+        evaluation = Evaluation(
+            candidate_name="José García",
+            job_name="test_job",
+            overall_score=85,
+            recommendation=RecommendationType.YES,
+            strengths=["Python"],
+            concerns=[],
+            interview_priority=InterviewPriority.HIGH,
+            detailed_notes="Good candidate",
+            timestamp=datetime(2025, 1, 2, 3, 4, 5, 678901),
+        )
+
+        text = json_utils.json_dumps(evaluation.to_dict(native_datetimes=True))
+
+        assert json.loads(text) == evaluation.to_dict()
+        assert "José García" in text
+
+    def test_unsupported_type_raises(self, encoder_backend):
+        """Test that unknown objects are rejected."""
+        with pytest.raises(TypeError):
+            json_utils.json_dumps({"value": object()})
+
+    def test_bytes_match_text(self, encoder_backend):
+        """Test that the bytes encoder matches the text encoder."""
+        data = {"name": "José", "when": datetime(2025, 1, 2, 3, 4, 5)}
+
+        assert json_utils.json_dumps_bytes(data) == json_utils.json_dumps(data).encode(
+            "utf-8"
+        )
+
+
+class TestJsonLoads:
+    """Test json_loads helper."""
+
+    @pytest.mark.parametrize(
+        "document", ['{"name": "José"}', b'{"name": "Jos\xc3\xa9"}']
+    )
+    def test_parses_text_and_bytes(self, encoder_backend, document):
+        """Test that text and UTF-8 bytes parse to the same value."""
+        assert json_utils.json_loads(document) == {"name": "José"}
+
+    def test_invalid_document_raises_decode_error(self, encoder_backend):
+        """Test that both backends raise the stdlib decode error type."""
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.json_loads(b"{not json")
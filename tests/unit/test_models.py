@@ -1,16 +1,20 @@
 """Unit tests for data models."""
 
+import dataclasses
 from datetime import datetime
 
 import pytest
 
 from models import (
     Candidate,
+    CandidateFiles,
+    ConnectionResult,
     Evaluation,
     HumanFeedback,
     InterviewPriority,
     JobContext,
     JobInsights,
+    ProcessingResult,
     RecommendationType,
 )
 
@@ -121,6 +125,9 @@ class TestEvaluation:
         assert evaluation.interview_priority == InterviewPriority.HIGH
         assert isinstance(evaluation.timestamp, datetime)
         assert evaluation.evaluation_id.startswith("eval_")
+        assert evaluation.evaluation_id == (
+            f"eval_{evaluation.timestamp.strftime('%Y%m%d_%H%M%S')}"
+        )
 
     def test_to_dict_conversion(self):
         """Test converting Evaluation to dictionary."""
@@ -200,3 +207,38 @@ class TestHumanFeedback:
         assert data["human_score"] == 30
         assert "timestamp" in data
         assert "feedback_id" in data
+
+
+class TestResultModels:
+    """Test result and file value objects."""
+
+    def test_value_objects_are_frozen(self):
+        """Test that immutable result objects reject attribute assignment."""
+        result = ConnectionResult(success=True, message="ok")
+        files = CandidateFiles(candidate_name="john_doe", resume_path="r.pdf")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            files.resume_path = "other.pdf"
+
+    def test_processing_result_lists_are_mutable(self):
+        """Test that ProcessingResult still accumulates candidates."""
+        result = ProcessingResult(success=True, job_name="test_job")
+
+        result.processed_candidates.append("john_doe")
+
+        assert result.processed_candidates == ["john_doe"]
+
+    def test_candidate_files_get_file_paths_skips_missing(self):
+        """Test that only provided file paths are returned."""
+        files = CandidateFiles(
+            candidate_name="john_doe",
+            resume_path="resume.pdf",
+            application_path="application.txt",
+        )
+
+        assert files.get_file_paths() == {
+            "resume": "resume.pdf",
+            "application": "application.txt",
+        }
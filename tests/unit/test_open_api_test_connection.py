@@ -0,0 +1,156 @@
+"""Unit tests for OpenAI connection testing and model selection."""
+
+import hashlib
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+import open_api_test_connection
+from open_api_test_connection import OpenAIConnectionTester
+
+
+@pytest.fixture
+def probe_cache(tmp_path, monkeypatch):
+    """Point the probe cache at a temporary file."""
+    cache_path = tmp_path / "model_probes.json"
+    monkeypatch.setattr(open_api_test_connection, "PROBE_CACHE_PATH", cache_path)
+    return cache_path
+
+
+def _mock_client(model_ids):
+    """Build a mock OpenAI client listing the given model ids."""
+    client = Mock()
+    client.models.list.return_value = Mock(data=[Mock(id=m) for m in model_ids])
+    return client
+
+
+class TestOpenAIConnectionTester:
+    """Test OpenAIConnectionTester functionality."""
+
+    def test_selects_preferred_model(self, probe_cache):
+        """Test that the preferred model wins when it is accessible."""
+        client = _mock_client(["gpt-4", "gpt-5"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key", "gpt-5")
+
+        assert tester.model == "gpt-5"
+
+    def test_successful_probe_is_cached(self, probe_cache):
+        """Test that a verified model is not probed again by a new tester."""
+        client = _mock_client(["gpt-5"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            OpenAIConnectionTester("test_key")
+            assert client.chat.completions.create.call_count == 1
+
+            tester = OpenAIConnectionTester("test_key")
+
+        assert tester.model == "gpt-5"
+        assert client.chat.completions.create.call_count == 1
+        assert probe_cache.exists()
+        assert "test_key" not in probe_cache.read_text()
+
+    def test_probe_cache_is_scoped_to_api_key(self, probe_cache):
+        """Test that cached probes are not shared between API keys."""
+        client = _mock_client(["gpt-5"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            OpenAIConnectionTester("first_key")
+            OpenAIConnectionTester("second_key")
+
+        assert client.chat.completions.create.call_count == 2
+
+    def test_expired_probe_is_repeated(self, probe_cache, monkeypatch):
+        """Test that probes older than the TTL are re-run."""
+        monkeypatch.setattr(open_api_test_connection, "PROBE_CACHE_TTL_SECONDS", 0)
+        client = _mock_client(["gpt-5"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            OpenAIConnectionTester("test_key")
+            OpenAIConnectionTester("test_key")
+
+        assert client.chat.completions.create.call_count == 2
+
+    @pytest.mark.parametrize(
+        "entries", [["gpt-4"], None, {"gpt-4": "yesterday"}, {"gpt-4": True}]
+    )
+    def test_malformed_probe_cache_is_ignored(self, probe_cache, entries):
+        """Test that unusable cache entries are re-probed instead of raising."""
+        key_digest = hashlib.sha256(b"test_key").hexdigest()[:16]
+        probe_cache.write_text(json.dumps({key_digest: entries}))
+        client = _mock_client(["gpt-4"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key")
+
+        assert tester.model == "gpt-4"
+        assert client.chat.completions.create.call_count == 1
+
+    def test_failed_probe_falls_back(self, probe_cache):
+        """Test that an inaccessible model falls back to the next candidate."""
+        client = _mock_client(["gpt-4", "gpt-5"])
+
+        def create(**kwargs):
+            if kwargs["model"] == "gpt-5":
+                raise RuntimeError("model not enabled")
+            return Mock()
+
+        client.chat.completions.create.side_effect = create
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key")
+
+        assert tester.model == "gpt-4"
+
+    def test_connection_reuses_model_list(self, probe_cache):
+        """Test that test_connection does not list models again."""
+        client = _mock_client(["gpt-4", "gpt-5"])
+        client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Connection successful"))]
+        )
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key")
+            result = tester.test_connection()
+
+        assert result.success
+        assert result.model_info == "Using: gpt-5 (Available GPT models: 2)"
+        assert client.models.list.call_count == 1
+
+    def test_models_indexed_by_priority_prefix(self, probe_cache):
+        """Test that refreshed models are grouped under each matching prefix."""
+        client = _mock_client(["gpt-4-turbo-2024", "gpt-5-mini", "gpt-5"])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key", "gpt-5")
+
+        assert tester._models_by_prefix["gpt-5"] == ["gpt-5-mini", "gpt-5"]
+        assert tester._models_by_prefix["gpt-4-turbo"] == ["gpt-4-turbo-2024"]
+        assert tester._models_by_prefix["gpt-5-nano"] == []
+
+    def test_failing_model_is_probed_once(self, probe_cache):
+        """Test that a model matching several prefixes is only probed once."""
+        client = _mock_client(["gpt-5-mini", "gpt-4"])
+
+        def create(**kwargs):
+            if kwargs["model"] == "gpt-5-mini":
+                raise RuntimeError("model not enabled")
+            return Mock()
+
+        client.chat.completions.create.side_effect = create
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key", "gpt-5")
+
+        probed = [
+            c.kwargs["model"] for c in client.chat.completions.create.call_args_list
+        ]
+        assert tester.model == "gpt-4"
+        assert probed == ["gpt-5-mini", "gpt-4"]
+        assert tester.model_priority.count("gpt-5") == 1
+
+    def test_reselect_recovers_after_refresh(self, probe_cache):
+        """Test that reselecting picks up a model listed after startup."""
+        client = _mock_client([])
+        with patch("open_api_test_connection.OpenAI", return_value=client):
+            tester = OpenAIConnectionTester("test_key", "gpt-5")
+            assert tester.model is None
+
+            client.models.list.return_value = Mock(data=[Mock(id="gpt-4")])
+            assert tester.refresh_available_models() == ["gpt-4"]
+            assert tester.reselect_model() == "gpt-4"
+
+        assert tester.model == "gpt-4"
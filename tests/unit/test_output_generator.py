@@ -1,15 +1,18 @@
 """Unit tests for output generator."""
 
+import json
 import os
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import json_utils
 from config import Config
 from models import Evaluation, InterviewPriority, JobContext, RecommendationType
-from output_generator import OutputGenerator
+from output_generator import CSV_FIELDNAMES, OutputGenerator, _format_timestamp
 
 
 class TestOutputGenerator:
@@ -70,6 +73,7 @@ class TestOutputGenerator:
                     assert "75" in content
                     assert "YES" in content
                     assert "MAYBE" in content
+                    assert content.splitlines()[0] == ",".join(CSV_FIELDNAMES)
 
     def test_html_report_generation(self):
         """Test HTML report generation."""
@@ -115,6 +119,34 @@ class TestOutputGenerator:
                     assert "90/100" in content
                     assert "STRONG_YES" in content
 
+    def test_html_report_escapes_evaluation_text(self):
+        """Test that AI-generated text cannot inject markup into the report."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"BASE_DATA_PATH": temp_dir}, clear=True):
+                generator = OutputGenerator(Config())
+
+                job_context = JobContext(name="test_job", description="Test job")
+                evaluation = Evaluation(
+                    candidate_name="john_doe",
+                    job_name="test_job",
+                    overall_score=70,
+                    recommendation=RecommendationType.MAYBE,
+                    strengths=["C++ & <templates>"],
+                    concerns=[],
+                    interview_priority=InterviewPriority.MEDIUM,
+                    detailed_notes="<script>alert(1)</script>",
+                )
+
+                html_path = generator.generate_html_report(
+                    job_context, [evaluation], temp_dir
+                )
+
+                with open(html_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                assert "<script>" not in content
+                assert "&lt;script&gt;alert(1)&lt;/script&gt;" in content
+                assert "<li>C++ &amp; &lt;templates&gt;</li>" in content
+
     def test_evaluation_json_saving(self):
         """Test saving individual evaluation as JSON."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -141,8 +173,6 @@ class TestOutputGenerator:
                 assert json_path.endswith("evaluation.json")
 
                 # Verify JSON content
-                import json
-
                 with open(json_path, "r") as f:
                     data = json.load(f)
                     assert data["candidate_name"] == "test_candidate"
@@ -196,6 +226,14 @@ class TestOutputGenerator:
             assert stats["lowest_score"] == 50
             assert stats["strong_candidates"] == 1  # Only STRONG_YES
             assert stats["high_priority_interviews"] == 1  # Only HIGH priority
+            assert stats["recommendation_counts"] == {
+                "STRONG_YES": 1,
+                "YES": 0,
+                "MAYBE": 1,
+                "NO": 1,
+                "STRONG_NO": 0,
+            }
+            assert stats["priority_counts"] == {"HIGH": 1, "MEDIUM": 1, "LOW": 1}
 
     def test_load_evaluations_for_job(self):
         """Test loading evaluations for a job."""
@@ -230,8 +268,6 @@ class TestOutputGenerator:
 
                     # Save evaluation
                     eval_path = candidate_dir / "evaluation.json"
-                    import json
-
                     with open(eval_path, "w") as f:
                         json.dump(evaluation.to_dict(), f)
 
@@ -243,6 +279,22 @@ class TestOutputGenerator:
                 assert "john_doe" in loaded_names
                 assert "jane_smith" in loaded_names
 
+    def test_load_evaluations_skips_undecodable_files(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """Test that non-UTF-8 JSON only warns with the stdlib fallback."""
+        monkeypatch.setattr(json_utils, "USE_ORJSON", False)
+        monkeypatch.setenv("BASE_DATA_PATH", str(tmp_path))
+        generator = OutputGenerator(Config())
+
+        candidate_dir = Path(generator.config.candidates_path) / "test_job" / "john_doe"
+        candidate_dir.mkdir(parents=True)
+        (candidate_dir / "evaluation.json").write_bytes(b'{"a": "\xff"}')
+        (candidate_dir / "candidate_meta.json").write_bytes(b'{"a": "\xff"}')
+
+        assert generator.load_evaluations_for_job("test_job") == []
+        assert "Could not load evaluation for john_doe" in capsys.readouterr().out
+
     def test_terminal_ranking_display(self):
         """Test terminal ranking display."""
         with patch.dict(os.environ, {}, clear=True):
@@ -280,3 +332,221 @@ class TestOutputGenerator:
                 success = False
 
             assert success
+
+    def test_rejection_metadata_loaded_once_per_job(self):
+        """Test rejection lookups share one directory scan, including name variants."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"BASE_DATA_PATH": temp_dir}, clear=True):
+                config = Config()
+                generator = OutputGenerator(config)
+
+                candidates_dir = Path(config.candidates_path) / "test_job"
+                for name, meta in [
+                    ("doe", {"rejected": True, "rejection_reason": "No visa"}),
+                    ("jane_smith", {"rejected": False}),
+                ]:
+                    (candidates_dir / name).mkdir(parents=True)
+                    (candidates_dir / name / "candidate_meta.json").write_text(
+                        json.dumps(meta)
+                    )
+
+                evaluations = [
+                    Evaluation(
+                        candidate_name=name,
+                        job_name="test_job",
+                        overall_score=score,
+                        recommendation=RecommendationType.YES,
+                        strengths=[],
+                        concerns=[],
+                        interview_priority=InterviewPriority.MEDIUM,
+                        detailed_notes="Notes",
+                    )
+                    for name, score in [("john_doe", 80), ("jane_smith", 70)]
+                ]
+
+                with patch.object(
+                    generator, "_scan_job_dir", wraps=generator._scan_job_dir
+                ) as scan_job_dir:
+                    csv_path = generator.generate_csv(evaluations, temp_dir, "test_job")
+
+                assert scan_job_dir.call_count == 1
+                content = Path(csv_path).read_text(encoding="utf-8")
+                assert "1,Rejected,john_doe" in content
+                assert "2,Active,jane_smith" in content
+                assert generator._get_rejection_info("test_job", "john_doe") == {
+                    "reason": "No visa",
+                    "timestamp": "Unknown",
+                }
+
+    def test_report_context_cached_until_invalidated(self):
+        """Test reports for one job share a single scan of candidate files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"BASE_DATA_PATH": temp_dir}, clear=True):
+                config = Config()
+                generator = OutputGenerator(config)
+
+                candidate_dir = Path(config.candidates_path) / "test_job" / "john_doe"
+                candidate_dir.mkdir(parents=True)
+                warning_path = candidate_dir / "DUPLICATE_WARNING.txt"
+                warning_path.write_text("DUPLICATE\nEmail matches\n")
+
+                job_context = JobContext(name="test_job", description="Test job")
+                evaluations = [
+                    Evaluation(
+                        candidate_name="john_doe",
+                        job_name="test_job",
+                        overall_score=80,
+                        recommendation=RecommendationType.YES,
+                        strengths=[],
+                        concerns=[],
+                        interview_priority=InterviewPriority.MEDIUM,
+                        detailed_notes="Notes",
+                    )
+                ]
+
+                with patch.object(
+                    generator, "_scan_job_dir", wraps=generator._scan_job_dir
+                ) as scan_job_dir:
+                    generator.generate_csv(evaluations, temp_dir, "test_job")
+                    generator.generate_html_report(job_context, evaluations, temp_dir)
+                    generator.display_terminal_ranking(evaluations, "test_job")
+                    assert scan_job_dir.call_count == 1
+
+                    warning_path.unlink()
+                    assert "john_doe" in generator._load_report_context("test_job")[1]
+
+                    generator.invalidate_job_cache("test_job")
+                    assert generator._load_report_context("test_job") == ({}, {})
+                    assert scan_job_dir.call_count == 2
+
+    def test_duplicate_warnings_summarized_per_candidate(self):
+        """Test duplicate warning files are summarized from a single scan."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"BASE_DATA_PATH": temp_dir}, clear=True):
+                config = Config()
+                generator = OutputGenerator(config)
+
+                candidates_dir = Path(config.candidates_path) / "test_job"
+                (candidates_dir / "john_doe").mkdir(parents=True)
+                (candidates_dir / "jane_smith").mkdir(parents=True)
+                (candidates_dir / "john_doe" / "DUPLICATE_WARNING.txt").write_text(
+                    "DUPLICATE\nEmail matches jane_smith\nPhone matches\nExtra\n"
+                    + "details " * 10_000,
+                    encoding="utf-8",
+                )
+
+                flags = generator._load_duplicate_warnings("test_job")
+
+                assert flags == {"john_doe": "Email matches jane_smith Phone matches"}
+                assert generator._load_duplicate_warnings("missing_job") == {}
+
+    def test_terminal_ranking_lists_rejected_with_reason(self, capsys):
+        """Test rejected candidates are split out with their rejection reason."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"BASE_DATA_PATH": temp_dir}, clear=True):
+                config = Config()
+                generator = OutputGenerator(config)
+
+                meta_dir = Path(config.candidates_path) / "test_job" / "john_doe"
+                meta_dir.mkdir(parents=True)
+                (meta_dir / "candidate_meta.json").write_text(
+                    json.dumps({"rejected": True, "rejection_reason": "Salary"})
+                )
+
+                evaluations = [
+                    Evaluation(
+                        candidate_name=name,
+                        job_name="test_job",
+                        overall_score=80,
+                        recommendation=RecommendationType.YES,
+                        strengths=[],
+                        concerns=[],
+                        interview_priority=InterviewPriority.MEDIUM,
+                        detailed_notes="Notes",
+                    )
+                    for name in ["john_doe", "jane_smith"]
+                ]
+
+                generator.display_terminal_ranking(evaluations, "test_job")
+
+                output = capsys.readouterr().out
+                assert "1. jane_smith" in output
+                assert "REJECTED CANDIDATES (1)" in output
+                assert "Reason: Salary" in output
+                # capsys is not a TTY, so no ANSI color codes are emitted
+                assert "\033[" not in output
+
+    def test_deduplicate_evaluations_merges_name_variants(self):
+        """Test deduplication keeps the most specific name and newest timestamp."""
+        with patch.dict(os.environ, {}, clear=True):
+            generator = OutputGenerator(Config())
+
+            def make(name, second):
+                return Evaluation(
+                    candidate_name=name,
+                    job_name="test_job",
+                    overall_score=70,
+                    recommendation=RecommendationType.MAYBE,
+                    strengths=[],
+                    concerns=[],
+                    interview_priority=InterviewPriority.MEDIUM,
+                    detailed_notes="Notes",
+                    timestamp=datetime(2024, 1, 1, 12, 0, second),
+                )
+
+            evaluations = [
+                make("doe", 0),
+                make("jane_smith", 0),
+                make("john_doe", 1),
+                make("doe_john_resume", 2),
+                make("smith_jane", 1),
+            ]
+
+            unique = generator._deduplicate_evaluations(evaluations, silent=True)
+
+            assert [e.candidate_name for e in unique] == [
+                "doe_john_resume",
+                "smith_jane",
+            ]
+
+    @pytest.mark.parametrize("workers", ["1", "4"])
+    def test_load_evaluations_serial_and_threaded(self, workers):
+        """Test evaluations load the same with and without the thread pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env = {"BASE_DATA_PATH": temp_dir, "LOAD_WORKERS": workers}
+            with patch.dict(os.environ, env, clear=True):
+                config = Config()
+                generator = OutputGenerator(config)
+
+                names = [f"candidate_{i:02d}" for i in range(40)]
+                for i, name in enumerate(names):
+                    evaluation = Evaluation(
+                        candidate_name=name,
+                        job_name="test_job",
+                        overall_score=i,
+                        recommendation=RecommendationType.MAYBE,
+                        strengths=[],
+                        concerns=[],
+                        interview_priority=InterviewPriority.MEDIUM,
+                        detailed_notes="Notes",
+                    )
+                    generator.save_evaluation_json(
+                        evaluation, config.get_candidate_path("test_job", name)
+                    )
+
+                loaded = generator.load_evaluations_for_job("test_job", silent=True)
+
+                assert sorted(e.candidate_name for e in loaded) == names
+                # Returned in score order, highest first
+                assert [e.overall_score for e in loaded] == list(range(39, -1, -1))
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            datetime(2024, 1, 2, 3, 4, 5),
+            datetime(2024, 12, 31, 23, 59, 59, 999999),
+        ],
+    )
+    def test_format_timestamp_matches_strftime(self, timestamp):
+        """Test the isoformat-based formatter matches the old strftime output."""
+        assert _format_timestamp(timestamp) == timestamp.strftime("%Y-%m-%d %H:%M:%S")
@@ -1,4 +1,5 @@
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -19,8 +20,6 @@ def _setup_minimal_job(tmp_path: Path):
 
     # Minimal evaluation required by provide_feedback
     eval_path = base / "candidates" / "j1" / "john_doe" / "evaluation.json"
-    from datetime import datetime
-
     evaluation = {
         "evaluation_id": "eval-1",
         "candidate_name": "john_doe",
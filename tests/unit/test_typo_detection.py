@@ -34,11 +34,15 @@ class TestTypoDetection:
 
         for prefix in prefixes:
             filename_start = filename[: len(prefix)].lower()
-            ratio = difflib.SequenceMatcher(
-                None, prefix.lower(), filename_start
-            ).ratio()
+            matcher = difflib.SequenceMatcher(None, prefix.lower(), filename_start)
 
-            if ratio > best_ratio and ratio > threshold:
+            # Skip the full ratio() when its upper bounds already lose
+            cutoff = max(best_ratio, threshold)
+            if matcher.real_quick_ratio() <= cutoff or matcher.quick_ratio() <= cutoff:
+                continue
+
+            ratio = matcher.ratio()
+            if ratio > cutoff:
                 best_match = prefix
                 best_ratio = ratio
 